@@ -4,6 +4,7 @@ pytest 전역 설정 및 픽스처
 import os
 import sys
 import pytest
+import pytest_asyncio
 import asyncio
 import tempfile
 import shutil
@@ -81,7 +82,7 @@ def client() -> Generator[TestClient, None, None]:
         yield test_client
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function")
 async def async_client() -> AsyncGenerator[httpx.AsyncClient, None]:
     """비동기 HTTP 클라이언트"""
     async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
@@ -281,20 +282,38 @@ pytest.mark.e2e = pytest.mark.e2e
 pytest.mark.slow = pytest.mark.slow
 
 # 테스트 설정
+def pytest_addoption(parser):
+    """커스텀 CLI 옵션"""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="실행 중인 API 서버가 필요한 통합 테스트(external 마커) 실행"
+    )
+
+
 def pytest_configure(config):
     """pytest 설정"""
     config.addinivalue_line("markers", "unit: 단위 테스트")
     config.addinivalue_line("markers", "integration: 통합 테스트") 
     config.addinivalue_line("markers", "e2e: End-to-End 테스트")
     config.addinivalue_line("markers", "slow: 느린 테스트")
+    config.addinivalue_line("markers", "external: 외부 서비스 의존 테스트 (--run-integration 필요)")
 
 
 def pytest_collection_modifyitems(config, items):
     """테스트 항목 수정"""
+    # 외부 서비스 의존 테스트는 옵션이 없으면 연결 시도 없이 수집 단계에서 건너뜀
+    run_external = config.getoption("--run-integration")
+    skip_external = pytest.mark.skip(reason="--run-integration 옵션 필요")
+    
     for item in items:
         # 비동기 테스트 마킹
         if asyncio.iscoroutinefunction(item.function):
             item.add_marker(pytest.mark.asyncio)
+        
+        if not run_external and "external" in item.keywords:
+            item.add_marker(skip_external)
 
 
 # 테스트 실행 전후 훅
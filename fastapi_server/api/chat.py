@@ -4,14 +4,18 @@
 대화형 상담 관련 API 엔드포인트를 정의합니다.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, List, Optional
 import logging
+import orjson
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # 로컬 모듈 import
 from fastapi_server.models.chat import ChatRequest, ChatResponse, ChatSession, ChatMessage
+from fastapi_server.models.common import new_message_id, utc_now, utc_now_iso
+from fastapi_server.api.dependencies import json_body, json_body_openapi
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -19,8 +23,11 @@ logger = logging.getLogger(__name__)
 # 임시 세션 저장소 (추후 SQLite로 대체)
 temp_sessions = {}
 
-@router.post("/message", response_model=ChatResponse)
-async def send_chat_message(request: ChatRequest):
+# 세션별 마지막 활동 시각 (UTC, 생성 시 기록하고 메시지 저장 시 갱신, 만료 판단에 사용)
+session_last_activity: Dict[str, datetime] = {}
+
+@router.post("/message", response_model=ChatResponse, openapi_extra=json_body_openapi(ChatRequest))
+async def send_chat_message(request: ChatRequest = Depends(json_body(ChatRequest))):
     """
     채팅 메시지 전송 및 AI 응답 생성
     
@@ -38,50 +45,112 @@ async def send_chat_message(request: ChatRequest):
         # 임시 AI 응답 생성
         ai_response = generate_mock_ai_response(request.message)
         
-        # 세션에 메시지 저장
-        if session_id not in temp_sessions:
-            temp_sessions[session_id] = []
-        
-        temp_sessions[session_id].extend([
-            {
-                "role": "user",
-                "content": request.message,
-                "timestamp": datetime.now().isoformat()
-            },
-            {
-                "role": "assistant", 
-                "content": ai_response,
-                "timestamp": datetime.now().isoformat()
-            }
-        ])
-        
-        response = ChatResponse(
-            response=ai_response,
-            session_id=session_id,
-            message_id=str(uuid.uuid4()),
-            processing_time=2.1,
-            confidence_score=0.89,
-            related_questions=[
-                "이 정책의 신청 자격은 무엇인가요?",
-                "신청 방법을 자세히 알려주세요",
-                "비슷한 다른 정책도 있나요?"
-            ],
-            sources=[
-                {
-                    "title": "관련 정책 문서",
-                    "url": "https://example.gov.kr/policy",
-                    "type": "document"
-                }
-            ]
-        )
+        save_message_pair(session_id, request.message, ai_response)
+        response = build_chat_response(session_id, ai_response)
         
         logger.info(f"채팅 응답 생성 완료: {session_id}")
-        return response
+        # 이미 검증된 모델이므로 response_model 재검증/jsonable_encoder를 거치지 않고 바로 직렬화
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         logger.error(f"채팅 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"채팅 처리 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/stream", openapi_extra=json_body_openapi(ChatRequest))
+async def stream_chat_message(request: ChatRequest = Depends(json_body(ChatRequest))):
+    """
+    채팅 메시지 전송 및 AI 응답 스트리밍 (Server-Sent Events)
+    
+    응답 텍스트를 생성되는 대로 `token` 이벤트로 보내고, 마지막에 /message와 같은
+    ChatResponse를 `done` 이벤트로 보냅니다. 클라이언트는 하나의 HTTP 응답으로
+    답변을 점진적으로 표시할 수 있습니다.
+    """
+    logger.info(f"채팅 스트리밍 메시지: {request.message}")
+    
+    session_id = request.session_id or str(uuid.uuid4())
+    
+    return StreamingResponse(
+        stream_chat_events(request.message, session_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def stream_chat_events(message: str, session_id: str) -> AsyncIterator[str]:
+    """
+    SSE 이벤트 생성기
+    
+    Args:
+        message: 사용자 메시지
+        session_id: 세션 ID
+        
+    Yields:
+        `data: <JSON>` 형식의 SSE 이벤트 문자열
+    """
+    try:
+        # /message와 같은 응답을 줄 단위 token 이벤트로 나누어 전송
+        ai_response = generate_mock_ai_response(message)
+        
+        for token in ai_response.splitlines(keepends=True):
+            yield format_sse_event({"type": "token", "content": token})
+        
+        save_message_pair(session_id, message, ai_response)
+        response = build_chat_response(session_id, ai_response)
+        yield format_sse_event({"type": "done", "response": response.model_dump(mode="json")})
+        
+        logger.info(f"채팅 스트리밍 완료: {session_id}")
+        
+    except Exception as e:
+        # 응답 헤더가 이미 전송되었으므로 HTTP 오류 대신 error 이벤트로 알림
+        logger.error(f"채팅 스트리밍 오류: {str(e)}")
+        yield format_sse_event({"type": "error", "detail": f"채팅 처리 중 오류가 발생했습니다: {str(e)}"})
+
+def format_sse_event(data: dict) -> str:
+    """dict를 SSE data 이벤트 문자열로 변환"""
+    return f"data: {orjson.dumps(data).decode()}\n\n"
+
+def save_message_pair(session_id: str, user_message: str, ai_response: str):
+    """세션에 사용자/AI 메시지 쌍 저장 (한 요청의 메시지 쌍은 같은 시각 사용)"""
+    if session_id not in temp_sessions:
+        temp_sessions[session_id] = []
+    
+    now = utc_now()
+    session_last_activity[session_id] = now
+    timestamp = now.isoformat()
+    temp_sessions[session_id].extend([
+        {
+            "role": "user",
+            "content": user_message,
+            "timestamp": timestamp
+        },
+        {
+            "role": "assistant", 
+            "content": ai_response,
+            "timestamp": timestamp
+        }
+    ])
+
+def build_chat_response(session_id: str, ai_response: str) -> ChatResponse:
+    """AI 응답 텍스트로 ChatResponse 생성 (임시 메타데이터 포함)"""
+    return ChatResponse(
+        response=ai_response,
+        session_id=session_id,
+        message_id=new_message_id(),
+        processing_time=2.1,
+        confidence_score=0.89,
+        related_questions=[
+            "이 정책의 신청 자격은 무엇인가요?",
+            "신청 방법을 자세히 알려주세요",
+            "비슷한 다른 정책도 있나요?"
+        ],
+        sources=[
+            {
+                "title": "관련 정책 문서",
+                "url": "https://example.gov.kr/policy",
+                "type": "document"
+            }
+        ]
+    )
+
 @router.post("/session", response_model=dict)
 async def create_chat_session():
     """
@@ -89,13 +158,15 @@ async def create_chat_session():
     """
     try:
         session_id = str(uuid.uuid4())
+        created_at = utc_now()
         temp_sessions[session_id] = []
+        session_last_activity[session_id] = created_at
         
         logger.info(f"새 세션 생성: {session_id}")
         
         return {
             "session_id": session_id,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at.isoformat(),
             "status": "active"
         }
         
@@ -118,7 +189,7 @@ async def get_chat_history(session_id: str):
             "session_id": session_id,
             "messages": messages,
             "total_count": len(messages),
-            "retrieved_at": datetime.now().isoformat()
+            "retrieved_at": utc_now_iso()
         }
         
     except HTTPException:
@@ -135,12 +206,13 @@ async def delete_chat_session(session_id: str):
     try:
         if session_id in temp_sessions:
             del temp_sessions[session_id]
+            session_last_activity.pop(session_id, None)
             logger.info(f"세션 삭제: {session_id}")
         
         return {
             "message": "세션이 삭제되었습니다.",
             "session_id": session_id,
-            "deleted_at": datetime.now().isoformat()
+            "deleted_at": utc_now_iso()
         }
         
     except Exception as e:
@@ -214,6 +286,29 @@ def generate_mock_ai_response(user_message: str) -> str:
         언제든 편하게 물어보세요! 😊
         """
 
+def cleanup_expired_sessions(expire_hours: int) -> int:
+    """
+    마지막 활동(생성 또는 메시지 저장) 이후 expire_hours가 지난 세션 삭제
+    
+    Args:
+        expire_hours: 세션 만료 시간 (시간)
+        
+    Returns:
+        삭제된 세션 수
+    """
+    cutoff = utc_now() - timedelta(hours=expire_hours)
+    
+    # 활동 시각 기록이 없는 세션도 정리 대상에 포함 (메시지 없이 남는 세션 누수 방지)
+    expired = [
+        session_id for session_id in temp_sessions
+        if session_last_activity.get(session_id, cutoff) <= cutoff
+    ]
+    for session_id in expired:
+        del temp_sessions[session_id]
+        session_last_activity.pop(session_id, None)
+    
+    return len(expired)
+
 @router.get("/health")
 async def chat_health_check():
     """채팅 서비스 상태 확인"""
@@ -221,5 +316,5 @@ async def chat_health_check():
         "status": "healthy",
         "service": "chat",
         "active_sessions": len(temp_sessions),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": utc_now_iso()
     }
@@ -0,0 +1,49 @@
+"""
+API 공용 의존성
+
+라우터에서 Depends로 주입받는 공유 리소스를 정의합니다.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Type, TypeVar
+
+import httpx
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """lifespan에서 생성한 공유 HTTP 클라이언트 반환"""
+    return request.app.state.http_client
+
+
+def json_body(model: Type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    요청 본문을 dict로 변환하지 않고 model_validate_json으로 바로 검증하는 의존성
+    
+    JSON 파싱과 검증이 모두 pydantic-core에서 한 번에 처리됩니다.
+    검증 실패 시 FastAPI 기본과 같은 422 응답을 반환합니다.
+    """
+    async def dependency(request: Request) -> ModelT:
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            errors = e.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("body", *error["loc"])
+            raise RequestValidationError(errors, body=body)
+    
+    return dependency
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """json_body 사용 라우트의 OpenAPI 요청 본문 스키마 (route의 openapi_extra에 전달)"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
@@ -3,12 +3,13 @@
 """
 import time
 import psutil
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Depends, status
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
 
 from fastapi_server.core.config import settings
 from fastapi_server.core.logging_config import get_logger, log_api_request
@@ -17,8 +18,13 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
-class HealthStatus(BaseModel):
+# 서버에서 직접 만드는 고정 형태의 응답이므로 검증 없는 dataclass 사용
+# (slots=True는 Python 3.10+ 전용이라 __slots__를 직접 선언, orjson이 dataclass를 바로 직렬화)
+@dataclass
+class HealthStatus:
     """헬스체크 응답 모델"""
+    __slots__ = ("status", "timestamp", "version", "uptime", "environment")
+    
     status: str
     timestamp: str
     version: str
@@ -26,8 +32,14 @@ class HealthStatus(BaseModel):
     environment: str
 
 
-class DetailedHealthStatus(BaseModel):
+@dataclass
+class DetailedHealthStatus:
     """상세 헬스체크 응답 모델"""
+    __slots__ = (
+        "status", "timestamp", "version", "uptime", "environment",
+        "system", "services", "database", "disk_usage"
+    )
+    
     status: str
     timestamp: str
     version: str
@@ -203,7 +215,8 @@ async def basic_health_check():
             response_time=response_time
         )
         
-        return response
+        # response_model 재검증 없이 orjson으로 바로 직렬화
+        return ORJSONResponse(response)
         
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -314,7 +327,8 @@ async def detailed_health_check():
             overall_status=overall_status
         )
         
-        return response
+        # response_model 재검증 없이 orjson으로 바로 직렬화
+        return ORJSONResponse(response)
         
     except Exception as e:
         logger.error(f"Detailed health check failed: {e}")
@@ -4,19 +4,20 @@
 문서 검색 관련 API 엔드포인트를 정의합니다.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from typing import List, Optional
 import logging
 
 # 로컬 모듈 import 
 from fastapi_server.models.search import SearchRequest, SearchResponse, DocumentResult
 from fastapi_server.models.common import CategoryResponse
+from fastapi_server.api.dependencies import json_body, json_body_openapi
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.post("/query", response_model=SearchResponse)
-async def search_documents(request: SearchRequest):
+@router.post("/query", response_model=SearchResponse, openapi_extra=json_body_openapi(SearchRequest))
+async def search_documents(request: SearchRequest = Depends(json_body(SearchRequest))):
     """
     문서 검색 API
     
@@ -64,10 +65,16 @@ async def search_documents(request: SearchRequest):
             ],
             confidence_score=0.91
         )
+        # total_count는 전체 개수, results는 현재 페이지 (응답 생성 코드의 버그 확인용, -O 실행 시 제거)
+        assert response.total_count >= len(response.results), "Results count cannot exceed total_count"
         
         logger.info(f"검색 완료: {len(response.results)}개 결과")
-        return response
+        # 이미 검증된 모델이므로 response_model 재검증/jsonable_encoder를 거치지 않고 바로 직렬화
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
+    except AssertionError:
+        # 내부 버그는 검색 오류로 감싸 detail에 노출하지 않고 그대로 전파
+        raise
     except Exception as e:
         logger.error(f"검색 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"검색 처리 중 오류가 발생했습니다: {str(e)}")
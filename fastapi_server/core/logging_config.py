@@ -1,11 +1,11 @@
 """
 로깅 설정 모듈 - JSON 포맷 로깅
 """
-import json
+import orjson
 import logging
 import logging.handlers
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional
 import traceback
@@ -24,7 +24,7 @@ class JSONFormatter(logging.Formatter):
         
         # 기본 로그 정보
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),  # 직렬화 시 ISO 8601(Z) 변환
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -66,7 +66,9 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'metrics'):
             log_data["metrics"] = record.metrics
         
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+        return orjson.dumps(
+            log_data, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        ).decode()
 
 
 class ContextFilter(logging.Filter):
@@ -18,6 +18,7 @@ from fastapi_server.core.agents.interfaces import (
     QueryAnalysisInput, DocumentRetrievalInput,
     ContentProcessingInput, ResponseGenerationInput
 )
+from fastapi_server.core.config import settings
 from fastapi_server.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -208,9 +209,13 @@ class WorkflowNodeImplementation:
             # 검색 결과를 DocumentResult 객체로 변환
             from fastapi_server.models.schemas import DocumentResult, DifficultyLevel
             
+            # search_results는 검증된 DocumentResult에서 만든 값이므로 운영 환경에서는
+            # 재검증 없이 model_construct로 생성 (DEBUG에서는 형태 오류 확인을 위해 검증)
+            build_document = DocumentResult if settings.DEBUG else DocumentResult.model_construct
+            
             documents = []
             for doc_data in state.get("search_results", []):
-                doc = DocumentResult(
+                doc = build_document(
                     id=doc_data["id"],
                     title=doc_data["title"],
                     content=doc_data["content"],
@@ -441,6 +446,7 @@ class WorkflowBuilder:
         )
         self.edges = ConditionalEdgeImplementation(config)
         self.config = WorkflowConfig.get_config(config)
+        self._workflow = None  # 컴파일된 워크플로우 캐시
     
     def build_graph(self) -> StateGraph:
         """LangGraph 빌드"""
@@ -500,7 +506,10 @@ class WorkflowBuilder:
         return graph
     
     def create_workflow(self) -> Any:
-        """실행 가능한 워크플로우 생성"""
+        """실행 가능한 워크플로우 생성 (최초 1회만 컴파일하고 이후 재사용)"""
+        if self._workflow is not None:
+            return self._workflow
+        
         graph = self.build_graph()
         
         # 메모리 체크포인터 설정 (선택적)
@@ -514,4 +523,5 @@ class WorkflowBuilder:
             "config": self.config
         })
         
+        self._workflow = workflow
         return workflow
\ No newline at end of file
@@ -1,10 +1,12 @@
 """
 LangGraph 상태 관리 시스템
 """
-from typing import TypedDict, Dict, List, Any, Optional, Literal, Union
+from typing import TypedDict, Dict, List, Any, Optional, Literal, Tuple, Union, Callable
 from typing_extensions import NotRequired
 from datetime import datetime
+from functools import lru_cache, wraps
 import json
+import sys
 
 from fastapi_server.models.schemas import DocumentResult, ChatMessage, DifficultyLevel
 
@@ -73,9 +75,15 @@ class WorkflowDecision(TypedDict):
 
 # === 상태 관리 클래스 ===
 
+# 상태에 반드시 값이 있어야 하는 필드
+_REQUIRED_STATE_FIELDS = ("session_id", "user_query", "current_step")
+
+
 class StateManager:
     """상태 관리 유틸리티"""
     
+    __slots__ = ()  # 정적 메서드/상수만 가지는 네임스페이스 클래스
+    
     @staticmethod
     def create_initial_state(session_id: str, user_query: str) -> AgentStateDict:
         """초기 상태 생성"""
@@ -84,7 +92,7 @@ class StateManager:
         return AgentStateDict(
             session_id=session_id,
             user_query=user_query,
-            current_step="query_analysis",
+            current_step=WorkflowNodes.QUERY_ANALYSIS,
             query_keywords=[],
             query_entities={},
             query_confidence=0.0,
@@ -111,17 +119,16 @@ class StateManager:
         state: AgentStateDict, 
         updates: Dict[str, Any]
     ) -> AgentStateDict:
-        """상태 업데이트"""
-        new_state = state.copy()
-        new_state.update(updates)
-        new_state["updated_at"] = datetime.utcnow().isoformat()
-        return new_state
+        """상태 업데이트 (새 상태 반환)"""
+        return {**state, **updates, "updated_at": datetime.utcnow().isoformat()}
     
     @staticmethod
     def set_step(state: AgentStateDict, step: str) -> AgentStateDict:
-        """처리 단계 변경"""
+        """처리 단계 변경 (단계명은 intern하여 저장)"""
+        # 단계명 검증은 개발 환경에서만 수행 (python -O 실행 시 제거됨)
+        assert step in WorkflowNodes._STEP_NODES_SET, f"Unknown workflow step: {step}"
         return StateManager.update_state(state, {
-            "current_step": step,
+            "current_step": sys.intern(step),
             "updated_at": datetime.utcnow().isoformat()
         })
     
@@ -129,7 +136,7 @@ class StateManager:
     def set_error(state: AgentStateDict, error_message: str) -> AgentStateDict:
         """에러 상태 설정"""
         return StateManager.update_state(state, {
-            "current_step": "error",
+            "current_step": WorkflowNodes.ERROR,
             "error_message": error_message,
             "retry_count": state.get("retry_count", 0) + 1
         })
@@ -140,7 +147,18 @@ class StateManager:
         step_name: str, 
         duration: float
     ) -> AgentStateDict:
-        """처리 시간 추가"""
+        """처리 시간 추가 (전달된 상태를 직접 수정, 중첩 dict는 이전 상태와 공유하지 않도록 복사)"""
+        state["processing_times"] = {**state.get("processing_times", {}), step_name: duration}
+        state["updated_at"] = datetime.utcnow().isoformat()
+        return state
+    
+    @staticmethod
+    def add_processing_time_copy(
+        state: AgentStateDict, 
+        step_name: str, 
+        duration: float
+    ) -> AgentStateDict:
+        """처리 시간 추가 (원본 상태는 유지하고 새 상태 반환)"""
         processing_times = state.get("processing_times", {}).copy()
         processing_times[step_name] = duration
         
@@ -154,7 +172,18 @@ class StateManager:
         key: str, 
         value: Any
     ) -> AgentStateDict:
-        """컨텍스트 정보 추가"""
+        """컨텍스트 정보 추가 (전달된 상태를 직접 수정, 중첩 dict는 이전 상태와 공유하지 않도록 복사)"""
+        state["context"] = {**state.get("context", {}), key: value}
+        state["updated_at"] = datetime.utcnow().isoformat()
+        return state
+    
+    @staticmethod
+    def add_context_copy(
+        state: AgentStateDict, 
+        key: str, 
+        value: Any
+    ) -> AgentStateDict:
+        """컨텍스트 정보 추가 (원본 상태는 유지하고 새 상태 반환)"""
         context = state.get("context", {}).copy()
         context[key] = value
         
@@ -165,29 +194,21 @@ class StateManager:
     @staticmethod
     def validate_state(state: AgentStateDict) -> bool:
         """상태 유효성 검증"""
-        required_fields = ["session_id", "user_query", "current_step"]
-        
-        for field in required_fields:
-            if field not in state or not state[field]:
+        for field in _REQUIRED_STATE_FIELDS:
+            if not state.get(field):
                 return False
         
-        valid_steps = [
-            "query_analysis", "document_retrieval", 
-            "content_processing", "response_generation", 
-            "completed", "error"
-        ]
-        
-        return state["current_step"] in valid_steps
+        return state["current_step"] in WorkflowNodes._STEP_NODES_SET
     
     @staticmethod
     def is_completed(state: AgentStateDict) -> bool:
         """완료 상태 확인"""
-        return state.get("current_step") == "completed"
+        return state.get("current_step") == WorkflowNodes.COMPLETED
     
     @staticmethod
     def is_error(state: AgentStateDict) -> bool:
         """에러 상태 확인"""
-        return state.get("current_step") == "error"
+        return state.get("current_step") == WorkflowNodes.ERROR
     
     @staticmethod
     def can_retry(state: AgentStateDict, max_retries: int = 3) -> bool:
@@ -207,7 +228,10 @@ class StateManager:
     @staticmethod
     def deserialize_state(state_json: str) -> AgentStateDict:
         """상태 역직렬화"""
-        return json.loads(state_json)
+        state = json.loads(state_json)
+        if isinstance(state.get("current_step"), str):
+            state["current_step"] = sys.intern(state["current_step"])
+        return state
 
 
 # === 워크플로우 노드 정의 ===
@@ -215,71 +239,96 @@ class StateManager:
 class WorkflowNodes:
     """워크플로우 노드 정의"""
     
-    # 노드 이름 상수
-    QUERY_ANALYSIS = "query_analysis"
-    DOCUMENT_RETRIEVAL = "document_retrieval"
-    CONTENT_PROCESSING = "content_processing"
-    RESPONSE_GENERATION = "response_generation"
-    COMPLETED = "completed"
-    ERROR = "error"
+    __slots__ = ()
+    
+    # 노드 이름 상수 (intern된 문자열 - 상태의 current_step과 동일 객체라 비교 시 memcmp 생략)
+    QUERY_ANALYSIS = sys.intern("query_analysis")
+    DOCUMENT_RETRIEVAL = sys.intern("document_retrieval")
+    CONTENT_PROCESSING = sys.intern("content_processing")
+    RESPONSE_GENERATION = sys.intern("response_generation")
+    COMPLETED = sys.intern("completed")
+    ERROR = sys.intern("error")
     
     # 조건부 라우팅 노드
     ROUTE_AFTER_ANALYSIS = "route_after_analysis"
     ROUTE_AFTER_RETRIEVAL = "route_after_retrieval"
     ROUTE_AFTER_PROCESSING = "route_after_processing"
     
+    # 노드 목록 (호출마다 리스트를 만들지 않도록 미리 구성)
+    _PROCESSING_NODES = (
+        QUERY_ANALYSIS,
+        DOCUMENT_RETRIEVAL,
+        CONTENT_PROCESSING,
+        RESPONSE_GENERATION,
+    )
+    _ROUTING_NODES = (
+        ROUTE_AFTER_ANALYSIS,
+        ROUTE_AFTER_RETRIEVAL,
+        ROUTE_AFTER_PROCESSING,
+    )
+    _ALL_NODES = _PROCESSING_NODES + (COMPLETED, ERROR) + _ROUTING_NODES
+    
+    # 멤버십 검사용 집합 (상태의 current_step으로 올 수 있는 단계 포함)
+    _ALL_NODES_SET = frozenset(_ALL_NODES)
+    _PROCESSING_NODES_SET = frozenset(_PROCESSING_NODES)
+    _STEP_NODES_SET = frozenset(_PROCESSING_NODES + (COMPLETED, ERROR))
+    
     @staticmethod
-    def get_all_nodes() -> List[str]:
+    def get_all_nodes() -> Tuple[str, ...]:
         """모든 노드 목록 반환"""
-        return [
-            WorkflowNodes.QUERY_ANALYSIS,
-            WorkflowNodes.DOCUMENT_RETRIEVAL,
-            WorkflowNodes.CONTENT_PROCESSING,
-            WorkflowNodes.RESPONSE_GENERATION,
-            WorkflowNodes.COMPLETED,
-            WorkflowNodes.ERROR,
-            WorkflowNodes.ROUTE_AFTER_ANALYSIS,
-            WorkflowNodes.ROUTE_AFTER_RETRIEVAL,
-            WorkflowNodes.ROUTE_AFTER_PROCESSING,
-        ]
+        return WorkflowNodes._ALL_NODES
     
     @staticmethod
-    def get_processing_nodes() -> List[str]:
+    def get_processing_nodes() -> Tuple[str, ...]:
         """처리 노드만 반환"""
-        return [
-            WorkflowNodes.QUERY_ANALYSIS,
-            WorkflowNodes.DOCUMENT_RETRIEVAL,
-            WorkflowNodes.CONTENT_PROCESSING,
-            WorkflowNodes.RESPONSE_GENERATION,
-        ]
+        return WorkflowNodes._PROCESSING_NODES
     
     @staticmethod
-    def get_routing_nodes() -> List[str]:
+    def get_routing_nodes() -> Tuple[str, ...]:
         """라우팅 노드만 반환"""
-        return [
-            WorkflowNodes.ROUTE_AFTER_ANALYSIS,
-            WorkflowNodes.ROUTE_AFTER_RETRIEVAL,
-            WorkflowNodes.ROUTE_AFTER_PROCESSING,
-        ]
+        return WorkflowNodes._ROUTING_NODES
 
 
 # === 조건부 라우팅 로직 ===
 
+# 에러 메시지 키워드 → 재시도 노드 (위에서부터 먼저 일치하는 항목 사용)
+_ERROR_RETRY_ROUTES = (
+    ("analysis", WorkflowNodes.QUERY_ANALYSIS, "Retrying from query analysis"),
+    ("retrieval", WorkflowNodes.DOCUMENT_RETRIEVAL, "Retrying from document retrieval"),
+    ("processing", WorkflowNodes.CONTENT_PROCESSING, "Retrying from content processing"),
+)
+
+
+# 상태를 받아 다음 단계를 결정하는 라우터 함수
+RouterFunc = Callable[[AgentStateDict], WorkflowDecision]
+
+
+def _error_guard(reason: str) -> Callable[[RouterFunc], RouterFunc]:
+    """이미 에러 상태이면 라우터 본문을 건너뛰고 에러 노드로 보내는 데코레이터"""
+    def decorator(router: RouterFunc) -> RouterFunc:
+        @wraps(router)
+        def guarded(state: AgentStateDict) -> WorkflowDecision:
+            if state.get("current_step") == WorkflowNodes.ERROR:
+                return WorkflowDecision(
+                    next_step=WorkflowNodes.ERROR,
+                    reason=reason,
+                    confidence=1.0
+                )
+            return router(state)
+        return guarded
+    return decorator
+
+
 class WorkflowRouter:
     """워크플로우 라우팅 로직"""
     
+    __slots__ = ()
+    
     @staticmethod
+    @_error_guard("Analysis failed")
     def route_after_analysis(state: AgentStateDict) -> WorkflowDecision:
         """질의 분석 후 라우팅"""
         
-        # 에러 상태 확인
-        if state.get("current_step") == "error":
-            return WorkflowDecision(
-                next_step=WorkflowNodes.ERROR,
-                reason="Analysis failed",
-                confidence=1.0
-            )
-        
         # 질의 신뢰도 확인
         confidence = state.get("query_confidence", 0.0)
         
@@ -299,18 +348,11 @@ class WorkflowRouter:
         )
     
     @staticmethod
+    @_error_guard("Document retrieval failed")
     def route_after_retrieval(state: AgentStateDict) -> WorkflowDecision:
         """문서 검색 후 라우팅"""
         
-        # 에러 상태 확인
-        if state.get("current_step") == "error":
-            return WorkflowDecision(
-                next_step=WorkflowNodes.ERROR,
-                reason="Document retrieval failed",
-                confidence=1.0
-            )
-        
-        # 검색 결과 확인
+        # 검색 결과 수에 따른 분기
         results_count = state.get("total_results_count", 0)
         
         if results_count == 0:
@@ -321,7 +363,6 @@ class WorkflowRouter:
                 metadata={"results_count": results_count}
             )
         
-        # 결과가 너무 적은 경우 (< 2개)
         if results_count < 2:
             return WorkflowDecision(
                 next_step=WorkflowNodes.CONTENT_PROCESSING,
@@ -330,7 +371,6 @@ class WorkflowRouter:
                 metadata={"results_count": results_count, "warning": "limited_results"}
             )
         
-        # 정상적인 경우
         return WorkflowDecision(
             next_step=WorkflowNodes.CONTENT_PROCESSING,
             reason="Sufficient documents found",
@@ -339,17 +379,10 @@ class WorkflowRouter:
         )
     
     @staticmethod
+    @_error_guard("Content processing failed")
     def route_after_processing(state: AgentStateDict) -> WorkflowDecision:
         """내용 처리 후 라우팅"""
         
-        # 에러 상태 확인
-        if state.get("current_step") == "error":
-            return WorkflowDecision(
-                next_step=WorkflowNodes.ERROR,
-                reason="Content processing failed",
-                confidence=1.0
-            )
-        
         # 처리된 내용 확인
         simplified_content = state.get("simplified_content")
         
@@ -381,17 +414,10 @@ class WorkflowRouter:
         )
     
     @staticmethod
+    @_error_guard("Response generation failed")
     def route_after_response(state: AgentStateDict) -> WorkflowDecision:
         """응답 생성 후 라우팅"""
         
-        # 에러 상태 확인
-        if state.get("current_step") == "error":
-            return WorkflowDecision(
-                next_step=WorkflowNodes.ERROR,
-                reason="Response generation failed",
-                confidence=1.0
-            )
-        
         # 최종 응답 확인
         final_response = state.get("final_response")
         
@@ -435,36 +461,23 @@ class WorkflowRouter:
             )
         
         # 에러 원인에 따른 재시도 위치 결정
-        error_message = state.get("error_message", "")
+        error_message = state.get("error_message", "").lower()
         
-        if "analysis" in error_message.lower():
-            return WorkflowDecision(
-                next_step=WorkflowNodes.QUERY_ANALYSIS,
-                reason="Retrying from query analysis",
-                confidence=0.5,
-                metadata={"retry_from": "analysis"}
-            )
-        elif "retrieval" in error_message.lower():
-            return WorkflowDecision(
-                next_step=WorkflowNodes.DOCUMENT_RETRIEVAL,
-                reason="Retrying from document retrieval",
-                confidence=0.5,
-                metadata={"retry_from": "retrieval"}
-            )
-        elif "processing" in error_message.lower():
-            return WorkflowDecision(
-                next_step=WorkflowNodes.CONTENT_PROCESSING,
-                reason="Retrying from content processing",
-                confidence=0.5,
-                metadata={"retry_from": "processing"}
-            )
-        else:
-            return WorkflowDecision(
-                next_step=WorkflowNodes.QUERY_ANALYSIS,
-                reason="Retrying from the beginning",
-                confidence=0.3,
-                metadata={"retry_from": "beginning"}
-            )
+        for keyword, next_step, reason in _ERROR_RETRY_ROUTES:
+            if keyword in error_message:
+                return WorkflowDecision(
+                    next_step=next_step,
+                    reason=reason,
+                    confidence=0.5,
+                    metadata={"retry_from": keyword}
+                )
+        
+        return WorkflowDecision(
+            next_step=WorkflowNodes.QUERY_ANALYSIS,
+            reason="Retrying from the beginning",
+            confidence=0.3,
+            metadata={"retry_from": "beginning"}
+        )
 
 
 # === 상태 전환 규칙 ===
@@ -472,25 +485,29 @@ class WorkflowRouter:
 class StateTransitionRules:
     """상태 전환 규칙 정의"""
     
+    __slots__ = ()
+    
     # 허용된 상태 전환 매핑
     VALID_TRANSITIONS = {
-        "query_analysis": ["document_retrieval", "error"],
-        "document_retrieval": ["content_processing", "error"],
-        "content_processing": ["response_generation", "error"],
-        "response_generation": ["completed", "error"],
-        "error": ["query_analysis", "document_retrieval", "content_processing", "response_generation"],
-        "completed": ["query_analysis"],  # 새로운 질의 시작
+        "query_analysis": frozenset({"document_retrieval", "error"}),
+        "document_retrieval": frozenset({"content_processing", "error"}),
+        "content_processing": frozenset({"response_generation", "error"}),
+        "response_generation": frozenset({"completed", "error"}),
+        "error": frozenset({"query_analysis", "document_retrieval", "content_processing", "response_generation"}),
+        "completed": frozenset({"query_analysis"}),  # 새로운 질의 시작
     }
     
     @staticmethod
+    @lru_cache(maxsize=64)
     def is_valid_transition(from_step: str, to_step: str) -> bool:
         """유효한 상태 전환인지 확인"""
-        return to_step in StateTransitionRules.VALID_TRANSITIONS.get(from_step, [])
+        return to_step in StateTransitionRules.VALID_TRANSITIONS.get(from_step, ())
     
     @staticmethod
-    def get_possible_next_steps(current_step: str) -> List[str]:
-        """현재 단계에서 가능한 다음 단계들"""
-        return StateTransitionRules.VALID_TRANSITIONS.get(current_step, [])
+    @lru_cache(maxsize=16)
+    def get_possible_next_steps(current_step: str) -> Tuple[str, ...]:
+        """현재 단계에서 가능한 다음 단계들 (정렬된 튜플)"""
+        return tuple(sorted(StateTransitionRules.VALID_TRANSITIONS.get(current_step, ())))
     
     @staticmethod
     def validate_state_transition(
@@ -521,6 +538,8 @@ class StateTransitionRules:
 class WorkflowConfig:
     """워크플로우 설정"""
     
+    __slots__ = ()
+    
     # 기본 설정값
     DEFAULT_CONFIG = {
         "max_retries": 3,
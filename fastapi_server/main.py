@@ -7,18 +7,22 @@ Multi-Agent 시스템을 활용한 정부 공문서 검색 및 상담 API 서버
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
+import asyncio
+import httpx
 import uvicorn
 import logging
-from contextlib import asynccontextmanager
-
-# 프로젝트 루트 경로 설정
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+
+# 스크립트로 직접 실행할 때만 프로젝트 루트 경로 추가
+# (uvicorn fastapi_server.main:app 등 패키지 import 시에는 불필요)
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent))
 
 # 로컬 모듈 import
-from fastapi_server.core.config import get_settings
+from fastapi_server.core.config import get_settings, settings
 from fastapi_server.api import search, chat, health
 
 # 로깅 설정
@@ -28,18 +32,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 기본 CORS 허용 오리진 (Streamlit 개발 서버)
+_DEFAULT_ALLOW_ORIGINS = (
+    "http://localhost:8501",
+    "http://127.0.0.1:8501",
+)
+
+# 세션 정리 주기 (초)
+_SESSION_CLEANUP_INTERVAL = 15 * 60
+
+
+async def _cleanup_sessions_periodically(expire_hours: int):
+    """만료된 채팅 세션을 주기적으로 정리"""
+    while True:
+        await asyncio.sleep(_SESSION_CLEANUP_INTERVAL)
+        removed = chat.cleanup_expired_sessions(expire_hours)
+        if removed:
+            logger.info(f"만료 세션 {removed}개 정리")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작 시 실행
     logger.info("🚀 정부 공문서 AI 검색 서비스 시작")
     
+    # 외부 서비스 호출용 공유 HTTP 클라이언트 (연결 풀 재사용)
+    app.state.http_client = httpx.AsyncClient(
+        timeout=settings.TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+    )
+    
     # Vector DB 초기화 (추후 구현)
     # await initialize_vector_db()
     
+    # 만료 세션 주기적 정리
+    cleanup_task = asyncio.create_task(
+        _cleanup_sessions_periodically(settings.SESSION_EXPIRE_HOURS)
+    )
+    
     yield  # 애플리케이션 실행
     
     # 종료 시 실행
+    cleanup_task.cancel()
+    try:
+        await cleanup_task
+    except asyncio.CancelledError:
+        pass
+    await app.state.http_client.aclose()
     logger.info("🛑 정부 공문서 AI 검색 서비스 종료")
 
 def create_app() -> FastAPI:
@@ -53,27 +92,28 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,  # orjson 기반 JSON 직렬화
         lifespan=lifespan
     )
     
     # CORS 미들웨어 설정
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "http://localhost:8501",  # Streamlit 개발 서버
-            "http://127.0.0.1:8501",
-            settings.CLIENT_URL if settings.CLIENT_URL else "http://localhost:8501"
-        ],
+        allow_origins=list(dict.fromkeys(
+            _DEFAULT_ALLOW_ORIGINS + ((settings.CLIENT_URL,) if settings.CLIENT_URL else ())
+        )),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
     
     # 신뢰할 수 있는 호스트 미들웨어
-    app.add_middleware(
-        TrustedHostMiddleware,
-        allowed_hosts=["localhost", "127.0.0.1", "*"]  # 개발용, 프로덕션에서는 제한 필요
-    )
+    # 미들웨어는 아무 검사를 하지 않아도 매 요청 호출되므로, 제한이 없으면(개발 모드, "*") 등록하지 않음
+    if not settings.DEBUG and settings.ALLOWED_HOSTS and "*" not in settings.ALLOWED_HOSTS:
+        app.add_middleware(
+            TrustedHostMiddleware,
+            allowed_hosts=settings.ALLOWED_HOSTS  # 환경변수 ALLOWED_HOSTS로 제한
+        )
     
     # API 라우터 등록
     app.include_router(health.router, prefix="/api/v1", tags=["health"])
@@ -96,12 +136,13 @@ async def root():
     }
 
 if __name__ == "__main__":
-    settings = get_settings()
-    
     uvicorn.run(
         "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,  # 개발 모드
+        host=settings.HOST,
+        port=settings.PORT,
+        reload=settings.DEBUG,  # 개발 모드에서만 자동 리로드
+        workers=1 if settings.DEBUG else settings.WORKERS,  # reload와 멀티 워커는 함께 사용 불가
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop은 Windows 미지원
+        http="httptools",
         log_level="info"
     )
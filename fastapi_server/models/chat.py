@@ -4,24 +4,27 @@
 채팅 API의 요청/응답 모델들을 정의합니다.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Dict, Any
-from datetime import datetime
-from .common import SourceInfo, BaseTimestampModel
+from .common import SourceInfo, BaseTimestampModel, utc_now_iso
 
 class ChatRequest(BaseModel):
     """채팅 요청 모델"""
     
-    message: str = Field(..., min_length=1, max_length=1000, description="사용자 메시지")
+    # 공백 제거는 pydantic-core에서 처리
+    model_config = ConfigDict(str_strip_whitespace=True, extra='ignore')
+    
+    message: str = Field(..., max_length=1000, description="사용자 메시지")
     session_id: Optional[str] = Field(None, description="세션 ID")
     context: Optional[Dict[str, Any]] = Field(None, description="추가 컨텍스트")
     
-    @validator('message')
-    def validate_message(cls, v):
+    @field_validator('message')
+    @classmethod
+    def validate_message(cls, v: str) -> str:
         """메시지 유효성 검사"""
-        if not v or not v.strip():
+        if not v:
             raise ValueError('메시지를 입력해주세요.')
-        return v.strip()
+        return v
 
 class ChatResponse(BaseModel):
     """채팅 응답 모델"""
@@ -39,7 +42,7 @@ class ChatResponse(BaseModel):
     sentiment: Optional[str] = Field(None, description="감정 분석 결과")
     
     # 메타데이터
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="응답 시간")
+    timestamp: str = Field(default_factory=utc_now_iso, description="응답 시간")
 
 class ChatMessage(BaseTimestampModel):
     """채팅 메시지 모델"""
@@ -64,7 +67,7 @@ class ChatSession(BaseTimestampModel):
     
     # 세션 통계
     message_count: int = Field(default=0, ge=0, description="총 메시지 수")
-    last_activity: str = Field(default_factory=lambda: datetime.now().isoformat(), description="마지막 활동 시간")
+    last_activity: str = Field(default_factory=utc_now_iso, description="마지막 활동 시간")
     
     # 메타데이터
     user_agent: Optional[str] = Field(None, description="사용자 에이전트")
@@ -4,10 +4,37 @@
 여러 모듈에서 공통으로 사용되는 데이터 모델들을 정의합니다.
 """
 
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+import itertools
+import os
+import sys
+import time
+
+
+def utc_now() -> datetime:
+    """현재 UTC 시각 반환 (datetime 필드 default_factory용)"""
+    return datetime.now(timezone.utc)
+
+
+def utc_now_iso() -> str:
+    """현재 UTC 시각을 ISO 8601 문자열로 반환 (default_factory용)"""
+    return utc_now().isoformat()
+
+
+# 메시지 ID: 프로세스 시작 시각(ms) + PID 접두사에 단조 증가 카운터를 붙임
+# (메시지마다 os.urandom을 호출하는 uuid4 대신 사용, 세션 ID는 추측 방지를 위해 uuid4 유지)
+_MESSAGE_ID_PREFIX = f"msg-{int(time.time() * 1000):x}-{os.getpid():x}"
+_message_counter = itertools.count(1)
+
+
+def new_message_id() -> str:
+    """프로세스 간에도 겹치지 않는 메시지 ID 생성 (default_factory용)"""
+    return f"{_MESSAGE_ID_PREFIX}-{next(_message_counter)}"
+
 
 class CategoryResponse(BaseModel):
     """카테고리 목록 응답 모델"""
@@ -19,13 +46,13 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="에러 메시지")
     error_code: Optional[str] = Field(None, description="에러 코드")
     details: Optional[Dict[str, Any]] = Field(None, description="에러 상세 정보")
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="에러 발생 시간")
+    timestamp: str = Field(default_factory=utc_now_iso, description="에러 발생 시간")
 
 class SuccessResponse(BaseModel):
     """성공 응답 모델"""
     message: str = Field(..., description="성공 메시지")
     data: Optional[Dict[str, Any]] = Field(None, description="추가 데이터")
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="응답 시간")
+    timestamp: str = Field(default_factory=utc_now_iso, description="응답 시간")
 
 class HealthStatus(Enum):
     """서비스 상태 열거형"""
@@ -51,39 +78,65 @@ class DocumentType(Enum):
     FORM = "form"
     OTHER = "other"
 
-class SourceInfo(BaseModel):
-    """소스 정보 모델"""
-    title: str = Field(..., description="소스 제목")
-    url: Optional[str] = Field(None, description="소스 URL")
-    type: str = Field(..., description="소스 타입")
-    reliability: Optional[float] = Field(None, ge=0, le=1, description="신뢰도 점수")
-
-class MetricData(BaseModel):
-    """메트릭 데이터 모델"""
-    name: str = Field(..., description="메트릭 이름")
-    value: float = Field(..., description="메트릭 값")
-    unit: Optional[str] = Field(None, description="단위")
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="측정 시간")
-
-class PaginationInfo(BaseModel):
-    """페이지네이션 정보 모델"""
-    page: int = Field(default=1, ge=1, description="현재 페이지")
-    page_size: int = Field(default=10, ge=1, le=100, description="페이지 크기")
-    total_count: int = Field(..., ge=0, description="전체 항목 수")
-    total_pages: int = Field(..., ge=0, description="전체 페이지 수")
-    has_next: bool = Field(..., description="다음 페이지 존재 여부")
-    has_previous: bool = Field(..., description="이전 페이지 존재 여부")
+# === 내부 값 객체 ===
+# 서버에서 조립되어 그대로 응답에 실리는 컨테이너는 Pydantic 모델 대신
+# 슬롯 dataclass로 정의합니다. 응답 모델의 필드로 쓰이면 Pydantic이
+# dataclass를 그대로 검증/직렬화합니다 (__post_init__의 ValueError는 ValidationError로 변환).
+# slots=True는 Python 3.10+ 전용이고, 기본값이 있는 필드는 __slots__를 직접 선언할 수 없으므로
+# 3.10 이상에서만 슬롯을 사용합니다.
+_VALUE_OBJECT_OPTIONS: Dict[str, Any] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _VALUE_OBJECT_OPTIONS["slots"] = True
+
+@dataclass(**_VALUE_OBJECT_OPTIONS)
+class SourceInfo:
+    """소스 정보"""
+    title: str                          # 소스 제목
+    type: str                           # 소스 타입
+    url: Optional[str] = None           # 소스 URL
+    reliability: Optional[float] = None # 신뢰도 점수 (0-1)
+    
+    def __post_init__(self) -> None:
+        if self.reliability is not None and not 0 <= self.reliability <= 1:
+            raise ValueError("reliability는 0과 1 사이여야 합니다")
+
+@dataclass(**_VALUE_OBJECT_OPTIONS)
+class MetricData:
+    """메트릭 데이터"""
+    name: str                           # 메트릭 이름
+    value: float                        # 메트릭 값
+    unit: Optional[str] = None          # 단위
+    timestamp: str = field(default_factory=utc_now_iso)  # 측정 시간
+
+@dataclass(**_VALUE_OBJECT_OPTIONS)
+class PaginationInfo:
+    """페이지네이션 정보"""
+    total_count: int                    # 전체 항목 수 (0 이상)
+    total_pages: int                    # 전체 페이지 수 (0 이상)
+    has_next: bool                      # 다음 페이지 존재 여부
+    has_previous: bool                  # 이전 페이지 존재 여부
+    page: int = 1                       # 현재 페이지 (1 이상)
+    page_size: int = 10                 # 페이지 크기 (1-100)
+    
+    def __post_init__(self) -> None:
+        if self.total_count < 0 or self.total_pages < 0:
+            raise ValueError("total_count와 total_pages는 0 이상이어야 합니다")
+        if self.page < 1:
+            raise ValueError("page는 1 이상이어야 합니다")
+        if not 1 <= self.page_size <= 100:
+            raise ValueError("page_size는 1과 100 사이여야 합니다")
 
 class BaseTimestampModel(BaseModel):
     """타임스탬프가 포함된 기본 모델"""
-    created_at: str = Field(default_factory=lambda: datetime.now().isoformat(), description="생성 시간")
+    created_at: str = Field(default_factory=utc_now_iso, description="생성 시간")
     updated_at: Optional[str] = Field(None, description="수정 시간")
 
-class ValidationError(BaseModel):
-    """유효성 검사 에러 모델"""
-    field: str = Field(..., description="에러가 발생한 필드")
-    message: str = Field(..., description="에러 메시지")
-    value: Optional[Any] = Field(None, description="잘못된 값")
+@dataclass(**_VALUE_OBJECT_OPTIONS)
+class ValidationError:
+    """유효성 검사 에러"""
+    field: str                          # 에러가 발생한 필드
+    message: str                        # 에러 메시지
+    value: Optional[Any] = None         # 잘못된 값
 
 class BulkResponse(BaseModel):
     """대량 처리 응답 모델"""
@@ -1,18 +1,35 @@
 """
 Pydantic 데이터 모델 정의
 """
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import List, Dict, Any, Optional, Union, Literal
+from typing_extensions import Annotated
 from uuid import UUID, uuid4
 import re
 
 
 from enum import Enum
 from pydantic import (
-    BaseModel, Field, validator, root_validator, 
+    BaseModel, Field, StringConstraints, WithJsonSchema, validator, root_validator, 
     field_validator, model_validator
 )
 
+from .common import new_message_id, utc_now
+
+_UTC = timezone.utc
+
+
+# 검증기에서 사용하는 정규식 (모듈 로드 시 1회 컴파일)
+_WS_RE = re.compile(r'\s+')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# 자유 형식 dict 필드용 타입: 값을 순회·복사하지 않고 그대로 통과 (스키마상으로는 object)
+# 타입 검증도 생략하므로 서버 내부/응답 모델에만 사용하고, 요청 모델은 Dict[str, Any]로 검증
+FreeformDict = Annotated[Any, WithJsonSchema({"type": "object"})]
+# 리스트 타입은 검증하되 요소(dict)는 재검증·복사하지 않음
+FreeformList = Annotated[List[Any], WithJsonSchema({"type": "array", "items": {"type": "object"}})]
+
+
 class MessageRole(str, Enum):
     """메시지 역할 열거형"""
     USER = "user"
@@ -62,6 +79,7 @@ class SearchRequest(BaseModel):
         max_length=500,
         description="검색 질의"
     )
+    # 유연한 카테고리 허용: 알려진 카테고리 외의 값도 그대로 통과 (별도 검증기 없음)
     category: Optional[str] = Field(
         None,
         max_length=50,
@@ -86,6 +104,10 @@ class SearchRequest(BaseModel):
         default=SortBy.RELEVANCE,
         description="정렬 기준"
     )
+    include_summary: bool = Field(
+        default=True,
+        description="요약 포함 여부"
+    )
     
     @field_validator('query')
     def normalize_query(cls, v):
@@ -94,7 +116,7 @@ class SearchRequest(BaseModel):
             raise ValueError("Query cannot be empty")
         
         # 공백 정규화
-        normalized = re.sub(r'\s+', ' ', v.strip())
+        normalized = _WS_RE.sub(' ', v.strip())
         
         # 길이 검증
         if len(normalized) < 2:
@@ -102,19 +124,6 @@ class SearchRequest(BaseModel):
         
         return normalized
     
-    @field_validator('category')
-    def validate_category(cls, v):
-        """카테고리 검증"""
-        if v is not None:
-            valid_categories = [
-                "법령", "행정서비스", "세무", "복지", "교육", 
-                "보건", "환경", "교통", "주거", "고용"
-            ]
-            if v not in valid_categories:
-                # 유연한 카테고리 허용 (경고 로그만)
-                pass
-        return v
-    
     class Config:
         schema_extra = {
             "example": {
@@ -123,7 +132,8 @@ class SearchRequest(BaseModel):
                 "max_results": 5,
                 "session_id": "session-123",
                 "filters": {"difficulty": "초급"},
-                "sort_by": "relevance"
+                "sort_by": "relevance",
+                "include_summary": True
             }
         }
 
@@ -135,7 +145,7 @@ class DocumentResult(BaseModel):
     title: str = Field(..., min_length=1, max_length=200, description="문서 제목")
     content: str = Field(..., min_length=1, description="문서 내용")
     category: str = Field(..., max_length=50, description="문서 카테고리")
-    published_date: str = Field(..., description="발행일 (YYYY-MM-DD)")
+    published_date: date = Field(..., description="발행일 (YYYY-MM-DD)")
     difficulty: DifficultyLevel = Field(..., description="난이도 수준")
     score: float = Field(
         ..., 
@@ -147,20 +157,11 @@ class DocumentResult(BaseModel):
         default_factory=list,
         description="하이라이트된 키워드"
     )
-    metadata: Dict[str, Any] = Field(
+    metadata: FreeformDict = Field(
         default_factory=dict,
         description="추가 메타데이터"
     )
     
-    @field_validator('published_date')
-    def validate_date_format(cls, v):
-        """날짜 형식 검증"""
-        try:
-            datetime.strptime(v, '%Y-%m-%d')
-        except ValueError:
-            raise ValueError("Date must be in YYYY-MM-DD format")
-        return v
-    
     @field_validator('content')
     def validate_content_length(cls, v):
         """내용 길이 검증"""
@@ -226,16 +227,6 @@ class SearchResponse(BaseModel):
         description="세션 ID"
     )
     
-    @field_validator('results')
-    def validate_results_consistency(cls, v, values):
-        """결과 일관성 검증"""
-        if 'total_count' in values:
-            actual_count = len(v)
-            # total_count는 전체 개수, results는 현재 페이지
-            if actual_count > values['total_count']:
-                raise ValueError("Results count cannot exceed total_count")
-        return v
-    
     class Config:
         schema_extra = {
             "example": {
@@ -268,44 +259,36 @@ class ChatMessage(BaseModel):
     """채팅 메시지 모델"""
     
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=new_message_id,
         description="메시지 고유 ID"
     )
     role: MessageRole = Field(..., description="메시지 역할")
-    content: str = Field(
-        ..., 
-        min_length=1,
-        max_length=10000,
-        description="메시지 내용"
-    )
+    # 공백 제거/길이 검증은 pydantic-core에서 처리
+    content: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=1, max_length=10000)
+    ] = Field(..., description="메시지 내용")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="메시지 시간"
     )
     session_id: str = Field(..., description="세션 ID")
-    metadata: Optional[Dict[str, Any]] = Field(
+    metadata: Optional[FreeformDict] = Field(
         default_factory=dict,
         description="메시지 메타데이터"
     )
     
     @field_validator('content')
     def validate_content(cls, v):
-        """메시지 내용 검증"""
-        if not v or not v.strip():
-            raise ValueError("Content cannot be empty")
-        
-        # HTML 태그 제거 (보안)
-        cleaned = re.sub(r'<[^>]+>', '', v.strip())
-        if not cleaned:
+        """메시지 내용 검증 (HTML 태그만으로 된 내용 거부)"""
+        if not _HTML_TAG_RE.sub('', v):
             raise ValueError("Content cannot contain only HTML tags")
-        
-        return v.strip()
+        return v
     
     @field_validator('timestamp')
     def validate_timestamp(cls, v):
         """타임스탬프 검증"""
         if v.tzinfo is None:
-            v = v.replace(tzinfo=timezone.utc)
+            v = v.replace(tzinfo=_UTC)
         return v
     
     class Config:
@@ -329,17 +312,15 @@ class ChatSession(BaseModel):
         description="세션 고유 ID"
     )
     user_id: Optional[str] = Field(None, description="사용자 ID")
-    title: str = Field(
-        default="새로운 대화",
-        max_length=100,
-        description="세션 제목"
-    )
+    title: Annotated[
+        str, StringConstraints(strip_whitespace=True, max_length=100)
+    ] = Field(default="새로운 대화", description="세션 제목")
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="생성 시간"
     )
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="마지막 업데이트 시간"
     )
     status: SessionStatus = Field(
@@ -351,7 +332,7 @@ class ChatSession(BaseModel):
         ge=0,
         description="메시지 수"
     )
-    metadata: Dict[str, Any] = Field(
+    metadata: FreeformDict = Field(
         default_factory=dict,
         description="세션 메타데이터"
     )
@@ -365,10 +346,8 @@ class ChatSession(BaseModel):
     
     @field_validator('title')
     def validate_title(cls, v):
-        """제목 검증"""
-        if not v or not v.strip():
-            return "새로운 대화"
-        return v.strip()
+        """제목 검증 (공백 제거 후 비어 있으면 기본 제목)"""
+        return v or "새로운 대화"
     
     class Config:
         schema_extra = {
@@ -390,20 +369,29 @@ class ChatSession(BaseModel):
 
 # === Agent 상태 관리 모델 ===
 
+# 단계별 허용 전환 (에러 상태에서는 모든 단계로 복구 가능)
+_VALID_STEP_TRANSITIONS = {
+    AgentStep.QUERY_ANALYSIS: frozenset({AgentStep.DOCUMENT_RETRIEVAL, AgentStep.ERROR}),
+    AgentStep.DOCUMENT_RETRIEVAL: frozenset({AgentStep.CONTENT_PROCESSING, AgentStep.ERROR}),
+    AgentStep.CONTENT_PROCESSING: frozenset({AgentStep.RESPONSE_GENERATION, AgentStep.ERROR}),
+    AgentStep.RESPONSE_GENERATION: frozenset({AgentStep.COMPLETED, AgentStep.ERROR}),
+    AgentStep.COMPLETED: frozenset({AgentStep.QUERY_ANALYSIS, AgentStep.ERROR}),  # 새 질의 시작 가능
+    AgentStep.ERROR: frozenset(AgentStep),
+}
+
 class AgentState(BaseModel):
     """Agent 워크플로우 상태 모델"""
     
     session_id: str = Field(..., description="세션 ID")
-    user_query: str = Field(
-        ..., 
-        min_length=1,
-        description="사용자 원본 질의"
-    )
+    user_query: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=1)
+    ] = Field(..., description="사용자 원본 질의")
     processed_query: Optional[str] = Field(
         None,
         description="처리된 질의"
     )
-    search_results: List[Dict[str, Any]] = Field(
+    # 상위 단계에서 이미 검증된 결과이므로 요소별 재검증 없이 그대로 보관
+    search_results: FreeformList = Field(
         default_factory=list,
         description="검색 결과 데이터"
     )
@@ -424,39 +412,6 @@ class AgentState(BaseModel):
         description="에러 메시지"
     )
     
-    @field_validator('user_query')
-    def validate_user_query(cls, v):
-        """사용자 질의 검증"""
-        if not v or not v.strip():
-            raise ValueError("User query is required")
-        return v.strip()
-    
-    @field_validator('current_step')
-    def validate_step_transition(cls, v, values):
-        """단계 전환 검증"""
-        # 에러 상태에서는 어떤 단계로든 전환 가능
-        if v == AgentStep.ERROR:
-            return v
-        
-        # 일반적인 단계 순서 검증 (선택적)
-        valid_transitions = {
-            AgentStep.QUERY_ANALYSIS: [AgentStep.DOCUMENT_RETRIEVAL, AgentStep.ERROR],
-            AgentStep.DOCUMENT_RETRIEVAL: [AgentStep.CONTENT_PROCESSING, AgentStep.ERROR],
-            AgentStep.CONTENT_PROCESSING: [AgentStep.RESPONSE_GENERATION, AgentStep.ERROR],
-            AgentStep.RESPONSE_GENERATION: [AgentStep.COMPLETED, AgentStep.ERROR],
-            AgentStep.COMPLETED: [AgentStep.QUERY_ANALYSIS, AgentStep.ERROR],  # 새 질의 시작 가능
-            AgentStep.ERROR: list(AgentStep)  # 에러에서는 모든 단계로 복구 가능
-        }
-        
-        return v
-    
-    @model_validator(mode='before')
-    def validate_error_state(cls, values):
-        """에러 상태 검증"""
-        if values.get('current_step') == AgentStep.ERROR and not values.get('error'):
-            raise ValueError("Error message is required when step is ERROR")
-        return values
-    
     def is_completed(self) -> bool:
         """완료 상태 확인"""
         return self.current_step == AgentStep.COMPLETED
@@ -465,6 +420,22 @@ class AgentState(BaseModel):
         """에러 상태 확인"""
         return self.current_step == AgentStep.ERROR
     
+    def transition_to(self, next_step: AgentStep) -> None:
+        """다음 처리 단계로 전환 (허용되지 않은 전환이면 ValueError)"""
+        if next_step not in _VALID_STEP_TRANSITIONS[self.current_step]:
+            raise ValueError(
+                f"Invalid step transition: {self.current_step.value} -> {AgentStep(next_step).value}"
+            )
+        # 에러 상태 불변식은 생성 시점이 아닌 ERROR로 전환하는 시점에 확인
+        if next_step == AgentStep.ERROR and not self.error:
+            raise ValueError("Error message is required when step is ERROR")
+        self.current_step = AgentStep(next_step)
+    
+    def set_error(self, error: str) -> None:
+        """에러 메시지를 기록하고 ERROR 단계로 전환"""
+        self.error = error
+        self.transition_to(AgentStep.ERROR)
+    
     def add_context(self, key: str, value: Any) -> None:
         """컨텍스트 정보 추가"""
         self.context[key] = value
@@ -558,9 +529,9 @@ class ErrorResponse(BaseModel):
     
     error: str = Field(..., description="에러 유형")
     message: str = Field(..., description="에러 메시지")
-    details: Optional[Dict[str, Any]] = Field(None, description="상세 정보")
+    details: Optional[FreeformDict] = Field(None, description="상세 정보")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="에러 발생 시간"
     )
     
@@ -4,31 +4,15 @@
 검색 API의 요청/응답 모델들을 정의합니다.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
-from datetime import datetime
-from .common import SourceInfo, BaseTimestampModel
+from .common import SourceInfo, BaseTimestampModel, utc_now_iso
 
-class SearchRequest(BaseModel):
-    """검색 요청 모델"""
-    
-    query: str = Field(..., min_length=1, max_length=500, description="검색 쿼리")
-    category: Optional[str] = Field(None, description="카테고리 필터")
-    max_results: int = Field(default=5, ge=1, le=20, description="최대 결과 수")
-    session_id: Optional[str] = Field(None, description="세션 ID")
-    include_summary: bool = Field(default=True, description="요약 포함 여부")
-    
-    @validator('query')
-    def validate_query(cls, v):
-        """쿼리 유효성 검사"""
-        if not v or not v.strip():
-            raise ValueError('검색어를 입력해주세요.')
-        
-        # 특수 문자 제한 (기본적인 것만)
-        if len(v.strip()) < 2:
-            raise ValueError('검색어는 2글자 이상 입력해주세요.')
-            
-        return v.strip()
+# 검색 요청 모델은 schemas.py 정의를 공유 (API/Agent 공통)
+from .schemas import SearchRequest
+
+# DocumentResult/SearchResponse는 API 응답 형식(요약, 원문 URL 등)이
+# Agent 내부용 schemas.DocumentResult(난이도, 하이라이트 등)와 달라 별도 정의
 
 class DocumentResult(BaseModel):
     """문서 검색 결과 모델"""
@@ -61,7 +45,7 @@ class SearchResponse(BaseModel):
     # 메타데이터
     query_info: Optional[Dict[str, Any]] = Field(None, description="쿼리 분석 정보")
     filters_applied: List[str] = Field(default_factory=list, description="적용된 필터")
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="검색 시간")
+    timestamp: str = Field(default_factory=utc_now_iso, description="검색 시간")
 
 class SearchHistory(BaseTimestampModel):
     """검색 히스토리 모델"""
@@ -4,21 +4,33 @@
 구조화된 로깅 시스템을 제공합니다.
 """
 
+import atexit
 import logging
-import json
+import logging.handlers
+import orjson
+import queue
 import sys
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+try:
+    import ormsgpack
+except ImportError:  # msgpack 파일 로그를 쓰지 않으면 불필요
+    ormsgpack = None
+
 class JSONFormatter(logging.Formatter):
     """JSON 형태로 로그를 포맷팅하는 클래스"""
     
     def format(self, record: logging.LogRecord) -> str:
         """로그 레코드를 JSON으로 포맷팅"""
+        return orjson.dumps(self.build_entry(record), option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def build_entry(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """로그 레코드를 직렬화 전 dict로 변환"""
         
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created),  # 직렬화 시 ISO 8601 변환
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -43,12 +55,64 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "session_id"):
             log_entry["session_id"] = record.session_id
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        return log_entry
+
+class MsgpackFileHandler(logging.FileHandler):
+    """로그 레코드를 msgpack 바이너리로 기록하는 파일 핸들러
+    
+    한글 메시지도 이스케이프 없이 그대로 기록되어 JSON보다 직렬화 비용이 낮습니다.
+    (콘솔처럼 사람이 읽는 출력에는 JSON/텍스트 포맷 사용)
+    """
+    
+    def __init__(self, filename: str):
+        if ormsgpack is None:
+            raise ImportError("msgpack 로그 파일을 사용하려면 ormsgpack 패키지가 필요합니다")
+        super().__init__(filename, mode="ab")
+        self._entry_formatter = JSONFormatter()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """레코드 하나를 msgpack 객체로 기록"""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(ormsgpack.packb(
+                self._entry_formatter.build_entry(record),
+                option=ormsgpack.OPT_NON_STR_KEYS
+            ))
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """같은 프로세스 내 큐로 레코드를 그대로 전달하는 QueueHandler
+    
+    기본 prepare()는 큐 전달 전에 메시지를 포맷팅하고 exc_info를 제거하므로,
+    포맷팅을 리스너 스레드로 넘기고 예외 정보를 JSON 포맷터에서 쓰도록 레코드를 유지합니다.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# 파일 핸들러를 소유하는 백그라운드 리스너 (setup_logging 재호출 시 교체)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_queue_listener() -> None:
+    """큐에 남은 레코드를 모두 기록하고 리스너 종료"""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
 
 def setup_logging(
     log_level: str = "INFO",
     log_format: str = "json",
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    log_file_format: str = "text"
 ) -> None:
     """
     로깅 시스템 설정
@@ -57,6 +121,7 @@ def setup_logging(
         log_level: 로그 레벨
         log_format: 로그 포맷 (json/text)
         log_file: 로그 파일 경로
+        log_file_format: 파일 로그 포맷 (text: log_format과 동일 / msgpack: 바이너리)
     """
     
     # 로그 레벨 설정
@@ -69,6 +134,7 @@ def setup_logging(
     # 기존 핸들러 제거
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listener()
     
     # 포맷터 선택
     if log_format.lower() == "json":
@@ -90,9 +156,20 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        if log_file_format.lower() == "msgpack":
+            file_handler = MsgpackFileHandler(log_file)
+        else:
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setFormatter(formatter)
+        
+        # 포맷팅과 디스크 쓰기는 리스너 스레드에서 처리 (요청 처리 경로에서 blocking write 제거)
+        global _queue_listener
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        root_logger.addHandler(_LocalQueueHandler(log_queue))
     
     logging.info(f"로깅 시스템 초기화 완료 - Level: {log_level}, Format: {log_format}")
 
@@ -131,35 +208,27 @@ def log_request(
     """
     
     logger = get_logger("api.request")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     extra_data = {
         "method": method,
         "path": path,
         "status_code": status_code,
-        "response_time": response_time,
-        "user_agent": user_agent,
-        "ip_address": ip_address
+        "response_time": response_time
     }
     
-    # None 값 제거
-    extra_data = {k: v for k, v in extra_data.items() if v is not None}
-    
-    # 로그 레코드에 추가 데이터 설정
-    log_record = logging.LogRecord(
-        name=logger.name,
-        level=logging.INFO,
-        pathname="",
-        lineno=0,
-        msg=f"{method} {path} - {status_code} ({response_time:.3f}s)",
-        args=(),
-        exc_info=None
-    )
-    
-    log_record.extra_data = extra_data
+    # 값이 있는 항목만 추가 (None 제거용 dict 재생성 방지)
+    if user_agent is not None:
+        extra_data["user_agent"] = user_agent
+    if ip_address is not None:
+        extra_data["ip_address"] = ip_address
+    
+    extra = {"extra_data": extra_data}
     if request_id:
-        log_record.request_id = request_id
+        extra["request_id"] = request_id
     
-    logger.handle(log_record)
+    logger.info(f"{method} {path} - {status_code} ({response_time:.3f}s)", extra=extra)
 
 def log_agent_activity(
     agent_name: str,
@@ -184,6 +253,9 @@ def log_agent_activity(
     """
     
     logger = get_logger(f"agent.{agent_name}")
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
     
     log_data = {
         "agent": agent_name,
@@ -200,29 +272,16 @@ def log_agent_activity(
         message += f" ({processing_time:.3f}s)"
     
     if success:
-        level = logging.INFO
         message += " - SUCCESS"
     else:
-        level = logging.ERROR
         message += f" - FAILED: {error_message}"
         log_data["error"] = error_message
     
-    # 로그 레코드 생성
-    log_record = logging.LogRecord(
-        name=logger.name,
-        level=level,
-        pathname="",
-        lineno=0,
-        msg=message,
-        args=(),
-        exc_info=None
-    )
-    
-    log_record.extra_data = log_data
+    extra = {"extra_data": log_data}
     if session_id:
-        log_record.session_id = session_id
+        extra["session_id"] = session_id
     
-    logger.handle(log_record)
+    logger.log(level, message, extra=extra)
 
 def log_search_activity(
     query: str,
@@ -245,6 +304,8 @@ def log_search_activity(
     """
     
     logger = get_logger("search.activity")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     extra_data = {
         "query": query,
@@ -256,21 +317,11 @@ def log_search_activity(
     
     message = f"검색: '{query}' - {results_count}개 결과 ({processing_time:.3f}s)"
     
-    log_record = logging.LogRecord(
-        name=logger.name,
-        level=logging.INFO,
-        pathname="",
-        lineno=0,
-        msg=message,
-        args=(),
-        exc_info=None
-    )
-    
-    log_record.extra_data = extra_data
+    extra = {"extra_data": extra_data}
     if session_id:
-        log_record.session_id = session_id
+        extra["session_id"] = session_id
     
-    logger.handle(log_record)
+    logger.info(message, extra=extra)
 
 def log_chat_activity(
     message: str,
@@ -293,6 +344,8 @@ def log_chat_activity(
     """
     
     logger = get_logger("chat.activity")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     extra_data = {
         "message_length": len(message),
@@ -302,23 +355,10 @@ def log_chat_activity(
         "intent": intent
     }
     
-    message_preview = message[:50] + "..." if len(message) > 50 else message
+    message_preview = message if len(message) <= 50 else f"{message[:50]}..."
     log_message = f"채팅: '{message_preview}' -> {response_length}자 응답 ({processing_time:.3f}s)"
     
-    log_record = logging.LogRecord(
-        name=logger.name,
-        level=logging.INFO,
-        pathname="",
-        lineno=0,
-        msg=log_message,
-        args=(),
-        exc_info=None
-    )
-    
-    log_record.extra_data = extra_data
-    log_record.session_id = session_id
-    
-    logger.handle(log_record)
+    logger.info(log_message, extra={"extra_data": extra_data, "session_id": session_id})
 
 # 기본 로깅 설정 (개발용)
 if __name__ != "__main__":
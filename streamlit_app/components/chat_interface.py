@@ -6,9 +6,45 @@
 
 import streamlit as st
 from streamlit_app.services.api_client import get_api_client, safe_api_call
+from streamlit_app.utils.helpers import (
+    fragment, rerun_fragment, polling_fragment, supports_polling_fragment, navigate_to
+)
 from datetime import datetime
+from typing import Optional
+import threading
 import time
 
+# 한 번에 렌더링할 최근 메시지 수 ("이전 메시지 더 보기" 클릭 시 같은 크기만큼 확장)
+CHAT_WINDOW_PAGE_SIZE = 50
+
+# 세션에 보관하는 최대 메시지 수 (초과 시 오래된 메시지부터 삭제)
+CHAT_HISTORY_LIMIT = 500
+
+# 카테고리별 추천 질문 (rerun마다 다시 만들지 않도록 모듈 상수로 정의)
+_COMMON_QUESTIONS = {
+    "🏠 주거/부동산": [
+        "전세자금대출 조건은 무엇인가요?",
+        "주택청약 신청 방법을 알려주세요",
+        "임대주택 입주 자격이 궁금해요"
+    ],
+    "👶 출산/육아": [
+        "출산 지원금은 얼마나 받을 수 있나요?",
+        "육아휴직 신청 절차를 알려주세요",
+        "어린이집 입소 신청은 어떻게 하나요?"
+    ],
+    "💼 사업/취업": [
+        "사업자 등록 필요 서류가 무엇인가요?",
+        "청년 창업 지원 정책을 알려주세요",
+        "고용보험 실업급여 신청 방법은?"
+    ],
+    "📋 민원/증명": [
+        "주민등록등본 온라인 발급 방법",
+        "가족관계증명서는 어디서 발급받나요?",
+        "인감증명서 발급 절차를 알려주세요"
+    ]
+}
+_COMMON_QUESTION_CATEGORIES = list(_COMMON_QUESTIONS)
+
 
 def render_chat_interface():
     """채팅 인터페이스 렌더링"""
@@ -16,6 +52,18 @@ def render_chat_interface():
     # 채팅 세션 초기화
     initialize_chat_session()
     
+    # 대화 영역 (메시지 전송 시 이 영역만 다시 실행)
+    render_chat_body()
+
+
+@fragment
+def render_chat_body():
+    """채팅 히스토리/입력/추천 질문 영역
+    
+    메시지를 보내면 히스토리도 함께 갱신되어야 하므로 세 영역을 하나의 fragment로 묶고,
+    페이지 이동 버튼만 전체 rerun을 사용합니다.
+    """
+    
     # 채팅 히스토리 표시
     render_chat_history()
     
@@ -26,6 +74,18 @@ def render_chat_interface():
     render_suggested_questions()
 
 
+# 세션별 잠금 객체를 만들 때만 잠깐 사용하는 전역 잠금 (세션 생성 API 호출 자체는 세션별로만 직렬화)
+_CHAT_SESSION_LOCK_GUARD = threading.Lock()
+
+
+def _get_chat_session_lock() -> threading.Lock:
+    """현재 브라우저 세션의 채팅 세션 생성 잠금 반환"""
+    with _CHAT_SESSION_LOCK_GUARD:
+        if '_chat_session_lock' not in st.session_state:
+            st.session_state._chat_session_lock = threading.Lock()
+        return st.session_state._chat_session_lock
+
+
 def initialize_chat_session():
     """채팅 세션 초기화"""
     
@@ -33,27 +93,32 @@ def initialize_chat_session():
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
     
-    if 'session_id' not in st.session_state or st.session_state.session_id is None:
-        # 새 세션 생성
-        client = get_api_client()
-        session_data = safe_api_call(client.create_session)
-        
-        if session_data:
-            st.session_state.session_id = session_data.get('session_id')
-            st.session_state.chat_start_time = datetime.now()
+    if 'chat_window_size' not in st.session_state:
+        st.session_state.chat_window_size = CHAT_WINDOW_PAGE_SIZE
+    
+    # 빠른 연속 rerun에서 세션이 두 번 생성되지 않도록 브라우저 세션별 잠금 안에서 확인 후 생성
+    with _get_chat_session_lock():
+        if st.session_state.get('session_id') is None:
+            # 새 세션 생성
+            client = get_api_client()
+            session_data = safe_api_call(client.create_session)
             
-            # 환영 메시지 추가
-            welcome_message = {
-                "type": "assistant",
-                "content": "안녕하세요! 👋 정부 공문서 전문 AI 상담원입니다. 궁금한 정책이나 행정 절차에 대해 무엇이든 편하게 물어보세요.",
-                "timestamp": datetime.now(),
-                "suggestions": [
-                    "주민등록등본 발급 방법",
-                    "출산 지원금 신청 절차", 
-                    "사업자 등록 필요 서류"
-                ]
-            }
-            st.session_state.chat_history.append(welcome_message)
+            if session_data:
+                st.session_state.session_id = session_data.get('session_id')
+                st.session_state.chat_start_time = datetime.now()
+                
+                # 환영 메시지 추가
+                welcome_message = {
+                    "type": "assistant",
+                    "content": "안녕하세요! 👋 정부 공문서 전문 AI 상담원입니다. 궁금한 정책이나 행정 절차에 대해 무엇이든 편하게 물어보세요.",
+                    "timestamp": datetime.now(),
+                    "suggestions": [
+                        "주민등록등본 발급 방법",
+                        "출산 지원금 신청 절차", 
+                        "사업자 등록 필요 서류"
+                    ]
+                }
+                st.session_state.chat_history.append(welcome_message)
 
 
 def render_chat_history():
@@ -68,54 +133,57 @@ def render_chat_history():
             st.markdown(f"**🕐 상담 시작:** {st.session_state.chat_start_time.strftime('%Y-%m-%d %H:%M')}")
             st.markdown("---")
         
-        # 메시지 히스토리 표시
-        for i, message in enumerate(st.session_state.chat_history):
-            render_message(message, i)
+        # 메시지 히스토리 표시 (최근 window개만 렌더링해 대화가 길어져도 rerun 비용 일정)
+        chat_history = st.session_state.chat_history
+        window = st.session_state.get('chat_window_size', CHAT_WINDOW_PAGE_SIZE)
+        start = max(len(chat_history) - window, 0)
+        
+        if start > 0:
+            if st.button(
+                f"💬 이전 메시지 더 보기 ({start}개)",
+                key="load_earlier_messages",
+                use_container_width=True
+            ):
+                st.session_state.chat_window_size = window + CHAT_WINDOW_PAGE_SIZE
+                rerun_fragment()
+        
+        # 버튼 key가 바뀌지 않도록 전체 히스토리 기준 인덱스 사용
+        # 추천 질문 버튼은 마지막 메시지에만 표시 (지난 추천은 의미가 없고 위젯 수가 히스토리에 비례해 늘어남)
+        last_index = len(chat_history) - 1
+        for i in range(start, len(chat_history)):
+            render_message(chat_history[i], i, show_suggestions=(i == last_index))
+        
+        # 백그라운드에서 응답을 기다리는 중이면 진행 표시 (완료 시 자동 갱신)
+        if 'pending_reply' in st.session_state:
+            render_pending_reply()
         
         # 자동 스크롤을 위한 앵커
         st.markdown('<div id="chat-bottom"></div>', unsafe_allow_html=True)
 
 
-def render_message(message: dict, index: int):
+def render_message(message: dict, index: int, show_suggestions: bool = True):
     """개별 메시지 렌더링"""
     
     message_type = message.get('type', 'user')
     content = message.get('content', '')
     timestamp = message.get('timestamp', datetime.now())
     
+    # Streamlit 기본 채팅 말풍선 사용 (내용은 마크다운으로 표시되며 HTML은 이스케이프됨)
     if message_type == 'user':
-        # 사용자 메시지 (오른쪽 정렬)
-        st.markdown(f"""
-        <div style="display: flex; justify-content: flex-end; margin: 1rem 0;">
-            <div style="max-width: 70%; background-color: #1f77b4; color: white; 
-                        padding: 1rem; border-radius: 15px 15px 5px 15px; 
-                        word-wrap: break-word;">
-                <div style="margin-bottom: 0.5rem;">{content}</div>
-                <div style="font-size: 0.8rem; opacity: 0.8; text-align: right;">
-                    👤 {timestamp.strftime('%H:%M')}
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # 사용자 메시지
+        with st.chat_message("user"):
+            st.markdown(content)
+            st.caption(f"👤 {timestamp.strftime('%H:%M')}")
     
     else:
-        # AI 응답 (왼쪽 정렬)
-        st.markdown(f"""
-        <div style="display: flex; justify-content: flex-start; margin: 1rem 0;">
-            <div style="max-width: 70%; background-color: #f0f2f6; color: #262730; 
-                        padding: 1rem; border-radius: 15px 15px 15px 5px; 
-                        word-wrap: break-word; border-left: 4px solid #1f77b4;">
-                <div style="margin-bottom: 0.5rem;">{content}</div>
-                <div style="font-size: 0.8rem; opacity: 0.6;">
-                    🤖 AI 상담원 {timestamp.strftime('%H:%M')}
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # AI 응답
+        with st.chat_message("assistant"):
+            st.markdown(content)
+            st.caption(f"🤖 AI 상담원 {timestamp.strftime('%H:%M')}")
         
         # 추천 질문이 있으면 버튼으로 표시
         suggestions = message.get('suggestions', [])
-        if suggestions:
+        if show_suggestions and suggestions:
             st.markdown("**💡 관련 질문:**")
             
             # 추천 질문을 버튼으로 표시
@@ -124,49 +192,28 @@ def render_message(message: dict, index: int):
             for i, suggestion in enumerate(suggestions):
                 col_idx = i % 2
                 with suggestion_cols[col_idx]:
-                    if st.button(
+                    # 추천 질문 클릭 시 자동으로 메시지 전송 (콜백은 재실행 전에 처리되므로 추가 rerun 불필요)
+                    st.button(
                         f"💬 {suggestion}",
                         key=f"suggestion_{index}_{i}",
-                        use_container_width=True
-                    ):
-                        # 추천 질문 클릭 시 자동으로 메시지 전송
-                        send_message(suggestion)
-                        st.rerun()
+                        use_container_width=True,
+                        on_click=send_message,
+                        args=(suggestion,),
+                        kwargs={"wait": False}
+                    )
 
 
 def render_message_input():
     """메시지 입력 영역"""
     
     st.markdown("---")
-    st.markdown("### 💬 메시지 입력")
     
-    # 메시지 입력 폼
-    with st.form(key="message_form", clear_on_submit=True):
-        col1, col2 = st.columns([4, 1])
-        
-        with col1:
-            user_message = st.text_area(
-                "메시지를 입력하세요",
-                placeholder="궁금한 점을 자유롭게 질문해주세요...",
-                height=100,
-                key="message_input",
-                label_visibility="collapsed"
-            )
-        
-        with col2:
-            st.markdown("<br>", unsafe_allow_html=True)  # 공간 조정
-            send_button = st.form_submit_button(
-                "📤 전송",
-                use_container_width=True,
-                type="primary"
-            )
-        
-        # 메시지 전송 처리
-        if send_button and user_message.strip():
-            send_message(user_message.strip())
-            st.rerun()
-        elif send_button:
-            st.warning("메시지를 입력해주세요.")
+    # 메시지 입력 (빈 메시지는 전송되지 않으며 전송 후 입력창은 자동으로 비워짐)
+    st.chat_input(
+        "궁금한 점을 자유롭게 질문해주세요...",
+        key="message_input",
+        on_submit=_handle_send
+    )
     
     # 빠른 액션 버튼들
     st.markdown("**⚡ 빠른 액션:**")
@@ -175,20 +222,19 @@ def render_message_input():
     with action_cols[0]:
         if st.button("🔄 새 대화", use_container_width=True):
             start_new_conversation()
-            st.rerun()
+            rerun_fragment()
     
     with action_cols[1]:
-        if st.button("📋 대화 저장", use_container_width=True):
-            save_conversation()
+        save_conversation()
     
     with action_cols[2]:
         if st.button("🔍 검색으로", use_container_width=True):
-            st.session_state.current_page = "검색"
+            navigate_to("검색")
             st.rerun()
     
     with action_cols[3]:
         if st.button("❓ 도움말", use_container_width=True):
-            st.session_state.current_page = "도움말"
+            navigate_to("도움말")
             st.rerun()
 
 
@@ -198,48 +244,45 @@ def render_suggested_questions():
     st.markdown("---")
     st.markdown("### 🎯 이런 질문들이 많이 물어봐요")
     
-    # 카테고리별 추천 질문
-    common_questions = {
-        "🏠 주거/부동산": [
-            "전세자금대출 조건은 무엇인가요?",
-            "주택청약 신청 방법을 알려주세요",
-            "임대주택 입주 자격이 궁금해요"
-        ],
-        "👶 출산/육아": [
-            "출산 지원금은 얼마나 받을 수 있나요?",
-            "육아휴직 신청 절차를 알려주세요",
-            "어린이집 입소 신청은 어떻게 하나요?"
-        ],
-        "💼 사업/취업": [
-            "사업자 등록 필요 서류가 무엇인가요?",
-            "청년 창업 지원 정책을 알려주세요",
-            "고용보험 실업급여 신청 방법은?"
-        ],
-        "📋 민원/증명": [
-            "주민등록등본 온라인 발급 방법",
-            "가족관계증명서는 어디서 발급받나요?",
-            "인감증명서 발급 절차를 알려주세요"
-        ]
-    }
+    # 카테고리 선택 (st.tabs는 보이지 않는 탭의 버튼까지 모두 만들기 때문에 선택된 카테고리만 렌더링)
+    category = st.radio(
+        "카테고리",
+        _COMMON_QUESTION_CATEGORIES,
+        horizontal=True,
+        key="active_question_category",
+        label_visibility="collapsed"
+    )
     
-    # 탭으로 카테고리 분리
-    tab_names = list(common_questions.keys())
-    tabs = st.tabs(tab_names)
+    for question in _COMMON_QUESTIONS[category]:
+        st.button(
+            f"💬 {question}",
+            key=f"common_{category}_{question}",
+            use_container_width=True,
+            on_click=send_message,
+            args=(question,),
+            kwargs={"wait": False}
+        )
+
+
+def _handle_send():
+    """채팅 입력 전송 콜백 (입력값은 위젯 key로 세션 상태에서 읽음)"""
     
-    for i, (category, questions) in enumerate(common_questions.items()):
-        with tabs[i]:
-            for question in questions:
-                if st.button(
-                    f"💬 {question}",
-                    key=f"common_{category}_{question}",
-                    use_container_width=True
-                ):
-                    send_message(question)
-                    st.rerun()
+    user_message = st.session_state.get('message_input') or ''
+    if user_message.strip():
+        send_message(user_message.strip(), wait=False)
 
 
-def send_message(message: str):
-    """메시지 전송 처리"""
+def send_message(message: str, wait: bool = True):
+    """메시지 전송 처리
+    
+    Args:
+        message: 사용자 메시지
+        wait: False이고 자동 재실행 fragment를 지원하면 응답을 기다리지 않고 반환
+              (응답은 render_pending_reply가 확인하여 히스토리에 추가)
+    """
+    
+    # 이전 응답이 아직 진행 중이면 먼저 마무리하여 순서 유지
+    finish_pending_reply()
     
     # 사용자 메시지를 히스토리에 추가
     user_message = {
@@ -247,61 +290,107 @@ def send_message(message: str):
         "content": message,
         "timestamp": datetime.now()
     }
-    st.session_state.chat_history.append(user_message)
+    append_to_history(user_message)
     
-    # 로딩 표시를 위한 임시 메시지 추가
-    loading_message = {
-        "type": "assistant",
-        "content": "🤔 답변을 생각하고 있습니다...",
-        "timestamp": datetime.now()
-    }
-    st.session_state.chat_history.append(loading_message)
+    client = get_api_client()
+    
+    # 스크립트 스레드를 막지 않고 백그라운드에서 응답 대기
+    if not wait and supports_polling_fragment:
+        st.session_state.pending_reply = client.submit_message(
+            message,
+            st.session_state.session_id
+        )
+        return
     
-    # API 호출하여 AI 응답 받기
+    # API 호출하여 AI 응답 받기 (로딩 표시는 spinner로만 하고 히스토리에는 최종 응답만 추가)
     with st.spinner('AI가 답변을 준비하고 있습니다...'):
-        client = get_api_client()
-        
         response_data = safe_api_call(
             client.send_message,
             message,
             st.session_state.session_id
         )
         
-        # 로딩 메시지 제거
-        st.session_state.chat_history.pop()
-        
-        if response_data:
-            # AI 응답을 히스토리에 추가
-            ai_message = {
-                "type": "assistant",
-                "content": response_data.get('message', '죄송합니다. 응답을 생성할 수 없습니다.'),
-                "timestamp": datetime.now(),
-                "suggestions": response_data.get('suggested_questions', []),
-                "confidence": response_data.get('confidence_score', 0)
-            }
-            st.session_state.chat_history.append(ai_message)
-            
-            # 세션 ID 업데이트 (응답에서 받은 경우)
-            if response_data.get('session_id'):
-                st.session_state.session_id = response_data['session_id']
+        append_ai_reply(response_data)
+
+
+def append_to_history(message: dict):
+    """히스토리에 메시지 추가 (CHAT_HISTORY_LIMIT를 넘으면 오래된 메시지 삭제)"""
+    
+    chat_history = st.session_state.chat_history
+    chat_history.append(message)
+    
+    if len(chat_history) > CHAT_HISTORY_LIMIT:
+        del chat_history[:len(chat_history) - CHAT_HISTORY_LIMIT]
+
+
+def append_ai_reply(response_data: Optional[dict]):
+    """AI 응답(또는 오류 안내)을 히스토리에 추가"""
+    
+    if response_data:
+        # AI 응답을 히스토리에 추가
+        ai_message = {
+            "type": "assistant",
+            "content": response_data.get('message', '죄송합니다. 응답을 생성할 수 없습니다.'),
+            "timestamp": datetime.now(),
+            "suggestions": response_data.get('suggested_questions', []),
+            "confidence": response_data.get('confidence_score', 0)
+        }
+        append_to_history(ai_message)
         
-        else:
-            # 오류 응답 추가
-            error_message = {
-                "type": "assistant",
-                "content": "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
-                "timestamp": datetime.now()
-            }
-            st.session_state.chat_history.append(error_message)
+        # 세션 ID 업데이트 (응답에서 받은 경우)
+        if response_data.get('session_id'):
+            st.session_state.session_id = response_data['session_id']
+    
+    else:
+        # 오류 응답 추가
+        error_message = {
+            "type": "assistant",
+            "content": "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+            "timestamp": datetime.now()
+        }
+        append_to_history(error_message)
+
+
+def finish_pending_reply():
+    """백그라운드 응답이 있으면 완료될 때까지 기다려 히스토리에 추가"""
+    
+    future = st.session_state.pop('pending_reply', None)
+    if future is not None:
+        append_ai_reply(safe_api_call(future.result))
+
+
+def _render_pending_reply():
+    """진행 중인 응답 확인 (완료되면 히스토리에 추가하고 대화 영역 갱신)"""
+    
+    future = st.session_state.get('pending_reply')
+    if future is None:
+        return
+    
+    if not future.done():
+        with st.chat_message("assistant"):
+            st.markdown("🤔 답변을 준비하고 있습니다...")
+        return
+    
+    finish_pending_reply()
+    st.rerun()
+
+
+# 진행 중인 응답이 있을 때만 호출되므로 응답이 끝나면 자동 재실행도 멈춤
+render_pending_reply = (
+    polling_fragment(run_every=0.5)(_render_pending_reply)
+    if supports_polling_fragment else _render_pending_reply
+)
 
 
 def start_new_conversation():
     """새 대화 시작"""
     
-    # 기존 채팅 데이터 초기화
+    # 기존 채팅 데이터 초기화 (진행 중인 이전 대화 응답은 버림)
+    st.session_state.pop('pending_reply', None)
     st.session_state.chat_history = []
     st.session_state.session_id = None
     st.session_state.chat_start_time = None
+    st.session_state.chat_window_size = CHAT_WINDOW_PAGE_SIZE
     
     # 새 세션 초기화
     initialize_chat_session()
@@ -309,40 +398,66 @@ def start_new_conversation():
     st.success("새로운 대화를 시작합니다! 🎉")
 
 
-def save_conversation():
-    """대화 내용 저장"""
+def build_conversation_markdown() -> str:
+    """대화 내용을 마크다운 텍스트로 변환
+    
+    같은 대화(세션 ID, 메시지 수, 마지막 메시지 시간)에 대해서는 세션 상태에 저장된 결과를 재사용합니다.
+    (다른 사용자와 공유되지 않도록 st.cache_data 대신 세션별로 보관)
+    """
+    
+    chat_history = st.session_state.get('chat_history', [])
+    session_id = st.session_state.get('session_id')
+    cache_key = (
+        session_id,
+        len(chat_history),
+        chat_history[-1].get('timestamp') if chat_history else None
+    )
     
-    if not st.session_state.chat_history:
-        st.warning("저장할 대화 내용이 없습니다.")
-        return
+    cached = st.session_state.get('conversation_export')
+    if cached and cached[0] == cache_key:
+        return cached[1]
     
-    # 대화 내용을 텍스트로 변환
-    conversation_text = f"# 정부 공문서 AI 상담 기록\n\n"
-    conversation_text += f"**상담 일시:** {st.session_state.get('chat_start_time', datetime.now()).strftime('%Y-%m-%d %H:%M')}\n"
-    conversation_text += f"**세션 ID:** {st.session_state.get('session_id', 'N/A')}\n\n"
-    conversation_text += "---\n\n"
+    start_time = st.session_state.get('chat_start_time') or datetime.now()
+    parts = [
+        "# 정부 공문서 AI 상담 기록\n\n",
+        f"**상담 일시:** {start_time.strftime('%Y-%m-%d %H:%M')}\n",
+        f"**세션 ID:** {session_id or 'N/A'}\n\n",
+        "---\n\n"
+    ]
     
-    for message in st.session_state.chat_history:
+    for message in chat_history:
         if message['type'] == 'user':
-            conversation_text += f"**👤 질문 ({message['timestamp'].strftime('%H:%M')})**\n"
-            conversation_text += f"{message['content']}\n\n"
+            parts.append(f"**👤 질문 ({message['timestamp'].strftime('%H:%M')})**\n")
+            parts.append(f"{message['content']}\n\n")
         else:
-            conversation_text += f"**🤖 답변 ({message['timestamp'].strftime('%H:%M')})**\n"
-            conversation_text += f"{message['content']}\n\n"
+            parts.append(f"**🤖 답변 ({message['timestamp'].strftime('%H:%M')})**\n")
+            parts.append(f"{message['content']}\n\n")
             
             # 추천 질문이 있으면 추가
             if message.get('suggestions'):
-                conversation_text += "**관련 질문:**\n"
+                parts.append("**관련 질문:**\n")
                 for suggestion in message['suggestions']:
-                    conversation_text += f"- {suggestion}\n"
-                conversation_text += "\n"
+                    parts.append(f"- {suggestion}\n")
+                parts.append("\n")
+    
+    conversation_text = "".join(parts)
+    st.session_state.conversation_export = (cache_key, conversation_text)
+    return conversation_text
+
+
+def save_conversation():
+    """대화 저장 (다운로드) 버튼
+    
+    클릭 후 다시 렌더링해야 나타나던 다운로드 버튼을 바로 표시합니다.
+    """
+    
+    has_history = bool(st.session_state.get('chat_history'))
     
-    # 다운로드 버튼 제공
     st.download_button(
-        label="📥 대화 기록 다운로드",
-        data=conversation_text,
+        label="📋 대화 저장",
+        data=build_conversation_markdown() if has_history else "",
         file_name=f"정부문서_AI상담_{datetime.now().strftime('%Y%m%d_%H%M')}.md",
-        mime="text/markdown"
+        mime="text/markdown",
+        use_container_width=True,
+        disabled=not has_history
     )
-    
-    st.success("대화 기록이 준비되었습니다! 다운로드 버튼을 클릭하세요.")
@@ -5,10 +5,24 @@
 """
 
 import streamlit as st
-from streamlit_app.services.api_client import get_api_client, safe_api_call
+from streamlit_app.services.api_client import (
+    APIError, cached_categories, cached_popular_queries, get_api_client, safe_api_call
+)
+from streamlit_app.utils.helpers import fragment, rerun_fragment, navigate_to
+from collections import deque
 from datetime import datetime
+from typing import Optional
 import time
 
+# 세션별로 보관하는 최근 검색어 수
+SEARCH_HISTORY_LIMIT = 10
+
+# 서버에서 카테고리 목록을 가져오지 못했을 때 사용하는 기본 목록
+DEFAULT_CATEGORIES = ["정책안내", "행정절차", "복지혜택", "세금정보", "사업지원"]
+
+# 카테고리 조회 실패 후 서버를 다시 호출하기까지 기본 목록을 사용하는 시간 (초)
+CATEGORY_RETRY_INTERVAL = 60
+
 
 def render_search_interface():
     """검색 인터페이스 렌더링"""
@@ -65,7 +79,7 @@ def render_search_input():
             with col1:
                 category_filter = st.selectbox(
                     "카테고리",
-                    ["전체", "정책안내", "행정절차", "복지혜택", "세금정보", "사업지원"],
+                    get_category_options(),
                     key="category_filter"
                 )
             
@@ -87,14 +101,31 @@ def render_search_input():
             st.warning("검색어를 입력해주세요.")
 
 
+def get_category_options() -> list:
+    """카테고리 필터 선택지 (서버 목록은 캐시 사용, 실패 시 기본 목록)
+    
+    보조 UI이므로 실패해도 오류 배너 없이 기본 목록을 쓰고,
+    CATEGORY_RETRY_INTERVAL 동안은 rerun마다 서버를 다시 호출하지 않습니다.
+    """
+    if time.time() < st.session_state.get('category_retry_at', 0):
+        return ["전체"] + DEFAULT_CATEGORIES
+    
+    try:
+        categories = cached_categories()
+    except APIError:
+        st.session_state.category_retry_at = time.time() + CATEGORY_RETRY_INTERVAL
+        categories = None
+    
+    return ["전체"] + (categories or DEFAULT_CATEGORIES)
+
+
 def render_popular_queries():
     """인기 검색어 표시"""
     
     st.markdown("### 🔥 인기 검색어")
     
-    # API에서 인기 검색어 가져오기
-    client = get_api_client()
-    popular_queries = safe_api_call(client.get_popular_queries)
+    # API에서 인기 검색어 가져오기 (rerun마다 호출하지 않도록 캐시 사용)
+    popular_queries = safe_api_call(cached_popular_queries)
     
     if popular_queries:
         # 인기 검색어를 버튼으로 표시
@@ -116,6 +147,12 @@ def render_popular_queries():
         st.info("인기 검색어를 불러오는 중입니다...")
 
 
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_search(query: str, category: Optional[str], max_results: int) -> dict:
+    """문서 검색 (같은 검색어/카테고리/결과 수는 10분간 결과 공유, 실패는 캐시되지 않음)"""
+    return get_api_client().search_documents(query, category, max_results)
+
+
 def perform_search(query: str, category: str = "전체", max_results: int = 5):
     """검색 실행"""
     
@@ -123,15 +160,12 @@ def perform_search(query: str, category: str = "전체", max_results: int = 5):
     with st.spinner('검색 중입니다...'):
         start_time = time.time()
         
-        # API 클라이언트로 검색 요청
-        client = get_api_client()
-        
         # 카테고리 필터 처리 (전체는 None으로)
         category_param = None if category == "전체" else category
         
-        # 검색 실행
+        # 검색 실행 (같은 조건의 검색은 캐시된 결과 사용)
         search_results = safe_api_call(
-            client.search_documents,
+            _cached_search,
             query,
             category_param,
             max_results
@@ -143,17 +177,11 @@ def perform_search(query: str, category: str = "전체", max_results: int = 5):
             # 검색 결과를 세션 상태에 저장
             st.session_state.last_search_results = search_results
             st.session_state.last_search_query = query
+            st.session_state.result_displays = {}
             st.session_state.search_time = end_time - start_time
             
             # 검색 히스토리에 추가
-            if 'search_history' not in st.session_state:
-                st.session_state.search_history = []
-            
-            if query not in st.session_state.search_history:
-                st.session_state.search_history.append(query)
-                # 최대 10개까지만 유지
-                if len(st.session_state.search_history) > 10:
-                    st.session_state.search_history.pop(0)
+            add_to_search_history(query)
             
             st.success(f"검색 완료! ({end_time - start_time:.2f}초)")
             st.rerun()
@@ -161,8 +189,38 @@ def perform_search(query: str, category: str = "전체", max_results: int = 5):
             st.error("검색 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
 
 
+def init_search_history():
+    """검색 히스토리 초기화 (최근 SEARCH_HISTORY_LIMIT개, 중복 확인용 set 포함)"""
+    if not isinstance(st.session_state.get('search_history'), deque):
+        st.session_state.search_history = deque(
+            st.session_state.get('search_history', ()),
+            maxlen=SEARCH_HISTORY_LIMIT
+        )
+        st.session_state.search_history_set = set(st.session_state.search_history)
+
+
+def add_to_search_history(query: str):
+    """검색어를 히스토리에 추가 (이미 있으면 무시, 가득 차면 가장 오래된 검색어 제거)"""
+    init_search_history()
+    history = st.session_state.search_history
+    history_set = st.session_state.search_history_set
+    
+    if query in history_set:
+        return
+    
+    if len(history) == history.maxlen:
+        history_set.discard(history[0])
+    history.append(query)
+    history_set.add(query)
+
+
+@fragment
 def render_search_results(results: dict):
-    """검색 결과 표시"""
+    """검색 결과 표시
+    
+    상세보기 등 결과 카드 안의 버튼은 이 영역만 다시 실행하여 인기 검색어 API를 다시 호출하지 않습니다.
+    (새 검색/페이지 이동은 전체 rerun)
+    """
     
     if not results or not results.get('results'):
         st.info("검색 결과가 없습니다.")
@@ -214,57 +272,80 @@ def render_search_results(results: dict):
                     st.rerun()
 
 
+def get_result_display(result: dict, index: int) -> dict:
+    """검색 결과 카드/상세보기에 표시할 메타데이터 문자열 반환
+    
+    처음 표시할 때 한 번 만들어 세션 상태에 결과 순번별로 보관하고(새 검색 시 초기화),
+    이후 expander 토글 등으로 rerun될 때는 그대로 재사용합니다.
+    결과 dict는 채팅 컨텍스트로도 넘어가므로 표시용 값을 넣지 않습니다.
+    """
+    displays = st.session_state.setdefault('result_displays', {})
+    display = displays.get(index)
+    if display is None:
+        display = displays[index] = build_result_display(result)
+    return display
+
+
+def build_result_display(result: dict) -> dict:
+    """검색 결과 카드/상세보기에 표시할 메타데이터 문자열 생성"""
+    
+    content = result.get('content', '')
+    category = result.get('category', '미분류')
+    confidence = f"{result.get('confidence_score', 0):.0%}"
+    publish_date = result.get('publish_date', '')
+    
+    # 결과 카드의 메타데이터 한 줄 (컬럼 3개 대신 마크다운 하나로 표시)
+    meta_parts = [f"**카테고리:** {category}", f"**관련도:** {confidence}"]
+    if publish_date:
+        meta_parts.append(f"**발행일:** {publish_date}")
+    
+    return {
+        "category": category,
+        "confidence": confidence,
+        "publish_date": publish_date,
+        "meta": " | ".join(meta_parts),
+        # 내용이 너무 길면 자르기
+        "preview": content if len(content) <= 300 else f"{content[:300]}..."
+    }
+
+
 def render_single_result(result: dict, index: int):
     """개별 검색 결과 렌더링"""
     
-    # 결과 메타데이터
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown(f"**카테고리:** {result.get('category', '미분류')}")
-    
-    with col2:
-        confidence = result.get('confidence_score', 0)
-        st.markdown(f"**관련도:** {confidence:.0%}")
+    display = get_result_display(result, index)
     
-    with col3:
-        publish_date = result.get('publish_date', '')
-        if publish_date:
-            st.markdown(f"**발행일:** {publish_date}")
+    # 결과 메타데이터
+    st.markdown(display['meta'])
     
     # 내용 미리보기
-    content = result.get('content', '')
-    if content:
-        # 내용이 너무 길면 자르기
-        if len(content) > 300:
-            preview = content[:300] + "..."
-        else:
-            preview = content
-        
+    if display['preview']:
         st.markdown("**내용 미리보기:**")
-        st.markdown(f"> {preview}")
+        st.markdown(f"> {display['preview']}")
     
-    # 액션 버튼들
-    col1, col2, col3 = st.columns(3)
+    # 액션 버튼들 (원문 링크가 없으면 컬럼 2개만 사용)
+    source_url = result.get('source_url', '')
+    action_cols = st.columns(3 if source_url else 2)
     
-    with col1:
-        if st.button(f"📖 자세히 보기", key=f"detail_{index}"):
-            show_detailed_view(result)
+    with action_cols[0]:
+        show_detail = st.button(f"📖 자세히 보기", key=f"detail_{index}")
     
-    with col2:
+    with action_cols[1]:
         if st.button(f"💬 관련 질문하기", key=f"chat_{index}"):
             # 채팅 페이지로 이동
-            st.session_state.current_page = "대화상담"
+            navigate_to("대화상담")
             st.session_state.chat_context = result
             st.rerun()
     
-    with col3:
-        source_url = result.get('source_url', '')
-        if source_url:
+    if source_url:
+        with action_cols[2]:
             st.markdown(f"[🌐 원문 보기]({source_url})")
+    
+    # 상세보기는 좁은 버튼 컬럼 안이 아니라 카드 전체 폭으로 표시
+    if show_detail:
+        show_detailed_view(result, index)
 
 
-def show_detailed_view(result: dict):
+def show_detailed_view(result: dict, index: int):
     """상세보기 표시"""
     
     # Streamlit에서는 실제 모달이 없으므로 별도 영역에 표시
@@ -275,19 +356,18 @@ def show_detailed_view(result: dict):
     st.markdown(f"## {result.get('title', '제목 없음')}")
     
     # 메타데이터
+    display = get_result_display(result, index)
     info_cols = st.columns(4)
     
     with info_cols[0]:
-        st.markdown(f"**카테고리**  \n{result.get('category', '미분류')}")
+        st.markdown(f"**카테고리**  \n{display['category']}")
     
     with info_cols[1]:
-        confidence = result.get('confidence_score', 0)
-        st.markdown(f"**관련도**  \n{confidence:.0%}")
+        st.markdown(f"**관련도**  \n{display['confidence']}")
     
     with info_cols[2]:
-        publish_date = result.get('publish_date', '')
-        if publish_date:
-            st.markdown(f"**발행일**  \n{publish_date}")
+        if display['publish_date']:
+            st.markdown(f"**발행일**  \n{display['publish_date']}")
     
     with info_cols[3]:
         doc_id = result.get('id', '')
@@ -309,4 +389,4 @@ def show_detailed_view(result: dict):
     
     # 닫기 버튼
     if st.button("❌ 닫기", key="close_detail"):
-        st.rerun()
+        rerun_fragment()
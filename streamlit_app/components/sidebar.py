@@ -6,6 +6,8 @@
 
 import streamlit as st
 from datetime import datetime
+from streamlit_app.utils.helpers import PAGES, fragment, navigate_to
+from streamlit_app.components.chat_interface import start_new_conversation
 
 
 def render_sidebar():
@@ -33,15 +35,18 @@ def render_sidebar():
             "❓ 도움말": "도움말"
         }
         
+        # 현재 페이지를 기본 선택으로 표시 (다른 화면의 버튼으로 이동한 경우에도 메뉴가 따라감)
+        current_page = st.session_state.get('current_page', PAGES[0])
         selected_page = st.radio(
             "페이지 선택",
             options=list(page_options.keys()),
-            index=0,
+            index=list(page_options.values()).index(current_page),
             label_visibility="collapsed"
         )
         
-        # 선택된 페이지를 세션 상태에 저장
-        st.session_state.current_page = page_options[selected_page]
+        # 메뉴에서 다른 페이지를 고른 경우에만 세션 상태/URL 갱신
+        if page_options[selected_page] != current_page:
+            navigate_to(page_options[selected_page])
         
         st.divider()
         
@@ -55,7 +60,7 @@ def render_sidebar():
         
         st.divider()
         
-        # 사용 통계
+        # 사용 통계 (접힌 expander + fragment라 평소에는 거의 비용이 들지 않음)
         render_usage_stats()
         
         st.divider()
@@ -134,9 +139,8 @@ def render_chat_settings():
     
     # 새 대화 시작 버튼
     if st.button("🔄 새 대화 시작", use_container_width=True):
-        st.session_state.session_id = None
-        st.session_state.chat_history = []
-        st.success("새로운 대화를 시작합니다!")
+        # 진행 중인 이전 대화 응답까지 버리도록 채팅 화면과 같은 초기화 사용
+        start_new_conversation()
         st.rerun()
     
     # 설정을 세션 상태에 저장
@@ -147,52 +151,62 @@ def render_chat_settings():
     }
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_usage_stats() -> dict:
+    """오늘의 사용 통계 조회 (1분간 캐시하여 rerun마다 조회하지 않음)"""
+    # TODO: 실제 사용 통계 데이터 연동 (Day 6에서)
+    # 현재는 더미 데이터 반환
+    return {
+        "search_count": ("12", "2"),
+        "chat_count": ("3", "1")
+    }
+
+
+@fragment
 def render_usage_stats():
     """사용 통계 표시"""
-    st.markdown("### 📊 오늘의 활동")
-    
-    # TODO: 실제 사용 통계 데이터 연동 (Day 6에서)
-    # 현재는 더미 데이터 표시
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.metric("검색 횟수", "12", "2")
-    
-    with col2:
-        st.metric("대화 수", "3", "1")
-    
-    # 최근 검색어
-    if 'search_history' in st.session_state and st.session_state.search_history:
-        st.markdown("**최근 검색어**")
-        for i, query in enumerate(st.session_state.search_history[-3:]):
-            st.markdown(f"• {query}")
-    else:
-        st.markdown("**최근 검색어**")
-        st.markdown("• 아직 검색 기록이 없습니다")
+    with st.expander("📊 오늘의 활동", expanded=False):
+        stats = _load_usage_stats()
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.metric("검색 횟수", *stats["search_count"])
+        
+        with col2:
+            st.metric("대화 수", *stats["chat_count"])
+        
+        # 최근 검색어
+        if 'search_history' in st.session_state and st.session_state.search_history:
+            st.markdown("**최근 검색어**")
+            for i, query in enumerate(list(st.session_state.search_history)[-3:]):
+                st.markdown(f"• {query}")
+        else:
+            st.markdown("**최근 검색어**")
+            st.markdown("• 아직 검색 기록이 없습니다")
 
 
+@fragment
 def render_feedback_section():
-    """피드백 섹션"""
-    st.markdown("### 💬 의견 보내기")
-    
-    feedback_type = st.selectbox(
-        "피드백 유형",
-        ["개선 제안", "버그 신고", "새 기능 요청", "기타"]
-    )
-    
-    feedback_text = st.text_area(
-        "의견을 자유롭게 적어주세요",
-        placeholder="서비스 개선을 위한 소중한 의견을 들려주세요...",
-        max_chars=500
-    )
-    
-    if st.button("📤 의견 보내기", use_container_width=True):
-        if feedback_text.strip():
-            # TODO: 실제 피드백 전송 로직 (Day 6에서)
-            st.success("소중한 의견 감사합니다! 검토 후 반영하겠습니다.")
-            st.balloons()
-        else:
-            st.warning("피드백 내용을 입력해주세요.")
+    """피드백 섹션 (입력 중 rerun이 이 영역에만 한정되도록 fragment로 렌더링)"""
+    with st.expander("💬 의견 보내기", expanded=False):
+        feedback_type = st.selectbox(
+            "피드백 유형",
+            ["개선 제안", "버그 신고", "새 기능 요청", "기타"]
+        )
+        
+        feedback_text = st.text_area(
+            "의견을 자유롭게 적어주세요",
+            placeholder="서비스 개선을 위한 소중한 의견을 들려주세요...",
+            max_chars=500
+        )
+        
+        if st.button("📤 의견 보내기", use_container_width=True):
+            if feedback_text.strip():
+                # TODO: 실제 피드백 전송 로직 (Day 6에서)
+                st.success("소중한 의견 감사합니다! 검토 후 반영하겠습니다.")
+                st.balloons()
+            else:
+                st.warning("피드백 내용을 입력해주세요.")
     
     # 서비스 정보
     st.markdown("---")
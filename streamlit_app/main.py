@@ -6,9 +6,10 @@
 
 import streamlit as st
 from streamlit_app.components.sidebar import render_sidebar
-from streamlit_app.components.search_interface import render_search_interface
+from streamlit_app.components.search_interface import render_search_interface, init_search_history
 from streamlit_app.components.chat_interface import render_chat_interface
-from streamlit_app.services.api_client import APIClient
+from streamlit_app.services.api_client import get_api_client
+from streamlit_app.utils.helpers import get_initial_page
 import logging
 
 # 로깅 설정
@@ -23,8 +24,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# CSS 스타일링
-st.markdown("""
+# CSS 스타일링 (헤더와 함께 main에서 한 번의 st.markdown으로 출력)
+PAGE_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -56,22 +57,55 @@ st.markdown("""
         background-color: #1d4ed8;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# 헤더
+HEADER_HTML = """
+<div class="main-header">
+    <h1>🏛️ 정부 공문서 AI 검색 서비스</h1>
+    <p style="font-size: 1.2rem; color: #64748b;">
+        복잡한 정부 정책과 공문서를 쉽게 이해할 수 있도록 도와드립니다
+    </p>
+</div>
+"""
+
+# 카테고리 카드
+CATEGORY_CARD_HTML = (
+    '<div style="border: 1px solid #e2e8f0; border-radius: 8px; padding: 1rem; margin: 0.5rem 0;">'
+    '<h4>{name}</h4>'
+    '<p style="color: #64748b; margin: 0.5rem 0;">{description}</p>'
+    '<small style="color: #94a3b8;">📄 {count}개 문서</small>'
+    '</div>'
+)
+
+# 임시 카테고리 목록 (TODO: 카테고리 브라우징 구현 시 API 데이터로 대체)
+SAMPLE_CATEGORIES = (
+    {"name": "💼 사업지원", "count": 203, "description": "창업, 사업자 등록, 지원금 정보"},
+    {"name": "👶 출산/육아", "count": 89, "description": "출산 지원금, 육아휴직, 보육 정책"},
+    {"name": "🏠 주거복지", "count": 156, "description": "주택 구입, 전세자금, 임대주택 정보"},
+    {"name": "💰 세금정보", "count": 178, "description": "소득세, 법인세, 세금 감면 혜택"},
+    {"name": "🎓 교육지원", "count": 134, "description": "장학금, 교육비 지원, 평생교육"},
+)
+
+# 정적 데이터이므로 두 컬럼의 카드 HTML을 import 시 한 번만 생성
+SAMPLE_CATEGORY_COLUMNS_HTML = tuple(
+    "\n".join(CATEGORY_CARD_HTML.format(**category) for category in column_categories)
+    for column_categories in (SAMPLE_CATEGORIES[0::2], SAMPLE_CATEGORIES[1::2])
+)
 
 
 def initialize_session_state():
     """세션 상태 초기화"""
     if 'api_client' not in st.session_state:
-        st.session_state.api_client = APIClient()
+        st.session_state.api_client = get_api_client()
     
     if 'session_id' not in st.session_state:
         st.session_state.session_id = None
     
-    if 'search_history' not in st.session_state:
-        st.session_state.search_history = []
+    init_search_history()
     
     if 'current_page' not in st.session_state:
-        st.session_state.current_page = "검색"
+        st.session_state.current_page = get_initial_page()
 
 
 def main():
@@ -79,15 +113,8 @@ def main():
     # 세션 상태 초기화
     initialize_session_state()
     
-    # 헤더
-    st.markdown("""
-    <div class="main-header">
-        <h1>🏛️ 정부 공문서 AI 검색 서비스</h1>
-        <p style="font-size: 1.2rem; color: #64748b;">
-            복잡한 정부 정책과 공문서를 쉽게 이해할 수 있도록 도와드립니다
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    # CSS + 헤더 (정적 HTML은 하나의 메시지로 전송)
+    st.markdown(PAGE_CSS + HEADER_HTML, unsafe_allow_html=True)
     
     # 사이드바 렌더링
     render_sidebar()
@@ -150,26 +177,9 @@ def render_category_page():
     # TODO: 카테고리 브라우징 구현 (Day 5에서)
     st.info("🚧 카테고리 탐색 기능은 곧 구현됩니다.")
     
-    # 임시 카테고리 목록
-    categories = [
-        {"name": "💼 사업지원", "count": 203, "description": "창업, 사업자 등록, 지원금 정보"},
-        {"name": "👶 출산/육아", "count": 89, "description": "출산 지원금, 육아휴직, 보육 정책"},
-        {"name": "🏠 주거복지", "count": 156, "description": "주택 구입, 전세자금, 임대주택 정보"},
-        {"name": "💰 세금정보", "count": 178, "description": "소득세, 법인세, 세금 감면 혜택"},
-        {"name": "🎓 교육지원", "count": 134, "description": "장학금, 교육비 지원, 평생교육"},
-    ]
-    
-    col1, col2 = st.columns(2)
-    for i, category in enumerate(categories):
-        with col1 if i % 2 == 0 else col2:
-            with st.container():
-                st.markdown(f"""
-                <div style="border: 1px solid #e2e8f0; border-radius: 8px; padding: 1rem; margin: 0.5rem 0;">
-                    <h4>{category['name']}</h4>
-                    <p style="color: #64748b; margin: 0.5rem 0;">{category['description']}</p>
-                    <small style="color: #94a3b8;">📄 {category['count']}개 문서</small>
-                </div>
-                """, unsafe_allow_html=True)
+    # 임시 카테고리 카드 (컬럼당 한 번만 출력)
+    for column, column_html in zip(st.columns(2), SAMPLE_CATEGORY_COLUMNS_HTML):
+        column.markdown(column_html, unsafe_allow_html=True)
 
 
 def render_help_page():
@@ -4,8 +4,19 @@
 AI와의 실시간 대화를 통한 정부 정책 상담 기능을 제공합니다.
 """
 
+import logging
+import time
 import streamlit as st
-from datetime import datetime
+
+from streamlit_app.services.api_client import get_api_client
+
+logger = logging.getLogger(__name__)
+
+# 메모리에 원문으로 유지할 최근 메시지 수 (그 이전은 요약 메시지 하나로 대체)
+MAX_TURNS = 40
+
+# 요약에 남길 이전 질문 수
+SUMMARY_QUESTION_LIMIT = 5
 
 def show_chat_page():
     """대화형 채팅 페이지 표시"""
@@ -15,11 +26,7 @@ def show_chat_page():
     # 채팅 히스토리 초기화
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = [
-            {
-                "role": "assistant",
-                "content": "안녕하세요! 정부 정책에 대해 궁금한 것이 있으면 언제든 물어보세요. 😊",
-                "timestamp": datetime.now()
-            }
+            new_message("assistant", "안녕하세요! 정부 정책에 대해 궁금한 것이 있으면 언제든 물어보세요. 😊")
         ]
     
     # 채팅 히스토리 표시
@@ -27,36 +34,128 @@ def show_chat_page():
     
     with chat_container:
         for message in st.session_state.chat_history:
-            if message["role"] == "user":
+            if message["role"] == "summary":
+                st.info(message["content"])
+            elif message["role"] == "user":
                 with st.chat_message("user"):
                     st.write(message["content"])
-                    st.caption(f"🕐 {message['timestamp'].strftime('%H:%M')}")
+                    st.caption(message["ts_str"])
             else:
                 with st.chat_message("assistant"):
                     st.write(message["content"])
-                    st.caption(f"🕐 {message['timestamp'].strftime('%H:%M')}")
+                    st.caption(message["ts_str"])
     
     # 메시지 입력
     user_input = st.chat_input("메시지를 입력하세요...")
     
     if user_input:
-        # 사용자 메시지 추가
-        st.session_state.chat_history.append({
-            "role": "user",
-            "content": user_input,
-            "timestamp": datetime.now()
-        })
+        # 사용자 메시지 추가 및 표시
+        user_message = new_message("user", user_input)
+        append_message(user_message)
+        
+        with st.chat_message("user"):
+            st.write(user_input)
+            st.caption(user_message["ts_str"])
+        
+        # AI 응답을 스트리밍으로 받아 같은 말풍선에 이어서 표시 (전체 페이지 재실행 없음)
+        with st.chat_message("assistant"):
+            ai_message = new_message("assistant", stream_ai_response(user_input, st.empty()))
+            st.caption(ai_message["ts_str"])
+        
+        append_message(ai_message)
+
+
+def new_message(role: str, content: str) -> dict:
+    """
+    채팅 메시지 생성
+    
+    시각은 time.time() 값으로 저장하고 표시용 문자열은 생성 시 한 번만 만들어
+    rerun마다 메시지별로 strftime을 반복하지 않습니다.
+    """
+    ts = time.time()
+    return {
+        "role": role,
+        "content": content,
+        "ts": ts,
+        "ts_str": f"🕐 {time.strftime('%H:%M', time.localtime(ts))}"
+    }
+
+
+def append_message(message: dict):
+    """히스토리에 메시지 추가 (MAX_TURNS를 넘는 앞부분은 요약 메시지 하나로 합침)"""
+    history = st.session_state.chat_history
+    history.append(message)
+    
+    summary = history[0] if history[0]["role"] == "summary" else None
+    recent = history[1:] if summary else history
+    if len(recent) <= MAX_TURNS:
+        return
+    
+    st.session_state.chat_history = [
+        summarize_messages(recent[:-MAX_TURNS], summary)
+    ] + recent[-MAX_TURNS:]
+
+
+def summarize_messages(messages: list, previous: dict = None) -> dict:
+    """
+    오래된 메시지들을 요약 메시지로 변환
+    
+    Args:
+        messages: 요약할 메시지 목록
+        previous: 기존 요약 메시지 (있으면 이어서 누적)
         
-        # AI 응답 (임시)
-        ai_response = f"'{user_input}'에 대한 정보를 찾고 있습니다. 잠시만 기다려주세요!"
-        st.session_state.chat_history.append({
-            "role": "assistant", 
-            "content": ai_response,
-            "timestamp": datetime.now()
-        })
+    Returns:
+        role이 "summary"인 메시지
+    """
+    count = len(messages) + (previous["count"] if previous else 0)
+    questions = (previous["questions"] if previous else []) + [
+        message["content"] for message in messages if message["role"] == "user"
+    ]
+    questions = questions[-SUMMARY_QUESTION_LIMIT:]
+    
+    content = f"📝 이전 대화 {count}개 메시지는 요약되었습니다."
+    if questions:
+        content += " 최근 질문: " + " / ".join(
+            question if len(question) <= 30 else f"{question[:30]}..." for question in questions
+        )
+    
+    return {
+        "role": "summary",
+        "content": content,
+        "count": count,
+        "questions": questions,
+        "ts": messages[-1]["ts"]
+    }
+
+
+def stream_ai_response(user_input: str, placeholder) -> str:
+    """
+    /api/v1/chat/stream 응답을 받는 대로 placeholder에 표시
+    
+    Args:
+        user_input: 사용자 메시지
+        placeholder: 응답을 갱신할 st.empty() 영역
         
-        # 페이지 새로고침
-        st.rerun()
+    Returns:
+        최종 응답 텍스트 (실패 시 안내 문구)
+    """
+    client = get_api_client()
+    buffer = ""
+    
+    try:
+        for event in client.stream_message(user_input, st.session_state.get('session_id')):
+            if event.get("type") == "token":
+                buffer += event.get("content", "")
+                placeholder.markdown(buffer + "▌")
+            elif event.get("type") == "done":
+                # 서버가 발급한 세션 ID를 이어서 사용
+                st.session_state.session_id = event["response"].get("session_id")
+    except Exception as e:
+        logger.error(f"스트리밍 응답 오류: {str(e)}")
+        buffer = "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+    
+    placeholder.markdown(buffer)
+    return buffer
 
 if __name__ == "__main__":
     show_chat_page()
@@ -5,9 +5,15 @@ FastAPI 서버와 통신하는 클라이언트 서비스를 제공합니다.
 """
 
 import httpx
+import orjson
 import asyncio
+import importlib.util
+import concurrent.futures
 import logging
-from typing import List, Optional, Dict, Any
+import queue
+import threading
+import weakref
+from typing import AsyncIterator, Iterator, List, Optional, Dict, Any
 from datetime import datetime
 import streamlit as st
 import os
@@ -15,22 +21,46 @@ import os
 # 환경변수에서 서버 URL 가져오기
 SERVER_URL = os.getenv("SERVER_URL", "http://localhost:8000")
 
+# 연결 풀 크기 (get_api_client로 모든 세션이 하나의 클라이언트를 공유)
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+# HTTP/2는 h2 패키지(httpx[http2])가 있을 때만 사용
+# (HTTPS에서 ALPN으로 협상되므로 nginx를 거치는 배포 환경에서 적용, 평문 http는 HTTP/1.1 유지)
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
 logger = logging.getLogger(__name__)
 
+# httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로, 호출마다 루프를 만들지 않고
+# 전용 스레드의 루프 하나에서 모든 비동기 호출을 실행 (연결 풀(keep-alive)도 재사용)
+_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, name="api-client-loop", daemon=True).start()
+
+
+class APIError(Exception):
+    """API 서버 호출 실패 (연결/HTTP 오류 또는 잘못된 응답)"""
+    pass
+
 
 class APIClient:
     """FastAPI 서버와 통신하는 클라이언트 클래스"""
     
-    def __init__(self, base_url: str = SERVER_URL, timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str = SERVER_URL,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         API 클라이언트 초기화
         
         Args:
             base_url: API 서버 기본 URL
             timeout: 요청 타임아웃 (초)
+            transport: HTTP 전송 계층 (테스트에서 httpx.MockTransport 주입용)
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.transport = transport
         self.session = None
         
         logger.info(f"API 클라이언트 초기화: {self.base_url}")
@@ -41,6 +71,9 @@ class APIClient:
             self.session = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=self.timeout,
+                limits=HTTP_POOL_LIMITS,
+                http2=HTTP2_ENABLED,
+                transport=self.transport,
                 headers={
                     "Content-Type": "application/json",
                     "User-Agent": "GovInfoAssistant-Client/1.0"
@@ -53,6 +86,17 @@ class APIClient:
         if self.session and not self.session.is_closed:
             await self.session.aclose()
     
+    async def aclose(self):
+        """세션 정리 (httpx와 같은 이름의 별칭)"""
+        await self.close()
+    
+    async def __aenter__(self) -> "APIClient":
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
     # 검색 관련 API
     async def search_documents(
         self, 
@@ -85,39 +129,40 @@ class APIClient:
             response = await session.post("/api/v1/search/query", json=payload)
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             logger.info(f"검색 완료: {result.get('total_count', 0)}개 결과")
             
             return result
             
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP 오류: {e.response.status_code} - {e.response.text}")
-            raise Exception(f"검색 요청 실패: {e.response.status_code}")
+            raise APIError(f"검색 요청 실패: {e.response.status_code}") from e
         except Exception as e:
             logger.error(f"검색 중 오류: {str(e)}")
-            raise Exception(f"검색 중 오류가 발생했습니다: {str(e)}")
+            raise APIError(f"검색 중 오류가 발생했습니다: {str(e)}") from e
     
-    async def get_categories(self) -> List[Dict[str, Any]]:
+    async def get_categories(self) -> Dict[str, Any]:
         """
         카테고리 목록 조회
         
         Returns:
-            List: 카테고리 목록
+            Dict: 카테고리 응답 (categories, total_count)
         """
         try:
             session = await self._get_session()
             
-            response = await session.get("/api/v1/search/categories")
+            # 필터 선택지 조회가 화면 렌더링을 오래 막지 않도록 짧은 타임아웃 사용
+            response = await session.get("/api/v1/search/categories", timeout=5.0)
             response.raise_for_status()
             
-            categories = response.json()
-            logger.info(f"카테고리 조회 완료: {len(categories)}개")
+            categories = orjson.loads(response.content)
+            logger.info(f"카테고리 조회 완료: {categories.get('total_count', 0)}개")
             
             return categories
             
         except Exception as e:
             logger.error(f"카테고리 조회 중 오류: {str(e)}")
-            raise Exception(f"카테고리 정보를 가져올 수 없습니다: {str(e)}")
+            raise APIError(f"카테고리 정보를 가져올 수 없습니다: {str(e)}") from e
     
     async def get_popular_queries(self) -> List[str]:
         """
@@ -132,14 +177,14 @@ class APIClient:
             response = await session.get("/api/v1/search/popular")
             response.raise_for_status()
             
-            queries = response.json()
+            queries = orjson.loads(response.content)
             logger.info(f"인기 검색어 조회 완료: {len(queries)}개")
             
             return queries
             
         except Exception as e:
             logger.error(f"인기 검색어 조회 중 오류: {str(e)}")
-            return []  # 실패시 빈 목록 반환
+            raise APIError(f"인기 검색어를 가져올 수 없습니다: {str(e)}") from e
     
     # 채팅 관련 API
     async def send_message(
@@ -170,14 +215,56 @@ class APIClient:
             response = await session.post("/api/v1/chat/message", json=payload)
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             logger.info(f"응답 수신: message_id={result.get('message_id')}")
             
             return result
             
         except Exception as e:
             logger.error(f"메시지 전송 중 오류: {str(e)}")
-            raise Exception(f"메시지 전송에 실패했습니다: {str(e)}")
+            raise APIError(f"메시지 전송에 실패했습니다: {str(e)}") from e
+    
+    async def stream_message(
+        self, 
+        message: str, 
+        session_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        채팅 메시지 전송 후 AI 응답을 SSE 이벤트로 스트리밍
+        
+        Args:
+            message: 사용자 메시지
+            session_id: 세션 ID
+            
+        Yields:
+            Dict: `token`(content) 이벤트들과 마지막 `done`(response) 이벤트
+        """
+        try:
+            session = await self._get_session()
+            
+            payload = {
+                "message": message,
+                "session_id": session_id
+            }
+            
+            logger.info(f"스트리밍 메시지 전송: session_id={session_id}")
+            
+            async with session.stream("POST", "/api/v1/chat/stream", json=payload) as response:
+                response.raise_for_status()
+                
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    
+                    event = orjson.loads(line[6:])
+                    if event.get("type") == "error":
+                        raise APIError(event.get("detail", "스트리밍 오류"))
+                    
+                    yield event
+            
+        except Exception as e:
+            logger.error(f"스트리밍 메시지 전송 중 오류: {str(e)}")
+            raise APIError(f"메시지 전송에 실패했습니다: {str(e)}") from e
     
     async def create_session(self, user_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -197,14 +284,14 @@ class APIClient:
             response = await session.post("/api/v1/chat/session", json=payload)
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             logger.info(f"세션 생성 완료: session_id={result.get('session_id')}")
             
             return result
             
         except Exception as e:
             logger.error(f"세션 생성 중 오류: {str(e)}")
-            raise Exception(f"세션 생성에 실패했습니다: {str(e)}")
+            raise APIError(f"세션 생성에 실패했습니다: {str(e)}") from e
     
     async def get_chat_history(
         self, 
@@ -230,14 +317,14 @@ class APIClient:
             )
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             logger.info(f"히스토리 조회 완료: {result.get('total_count', 0)}개 메시지")
             
             return result
             
         except Exception as e:
             logger.error(f"히스토리 조회 중 오류: {str(e)}")
-            raise Exception(f"채팅 히스토리를 가져올 수 없습니다: {str(e)}")
+            raise APIError(f"채팅 히스토리를 가져올 수 없습니다: {str(e)}") from e
     
     # 헬스체크
     async def health_check(self) -> bool:
@@ -253,7 +340,7 @@ class APIClient:
             response = await session.get("/api/v1/health", timeout=5.0)
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             return result.get("status") == "healthy"
             
         except Exception as e:
@@ -265,18 +352,12 @@ class APIClient:
 class SyncAPIClient:
     """동기식 API 클라이언트 (Streamlit용)"""
     
-    def __init__(self):
-        self.async_client = APIClient()
+    def __init__(self, async_client: Optional[APIClient] = None):
+        self.async_client = async_client or APIClient()
     
     def _run_async(self, coro):
-        """비동기 함수를 동기적으로 실행"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(coro)
+        """비동기 함수를 전용 이벤트 루프에서 실행하고 결과를 기다림"""
+        return asyncio.run_coroutine_threadsafe(coro, _LOOP).result()
     
     def search_documents(self, query: str, category: Optional[str] = None, max_results: int = 5) -> Dict[str, Any]:
         """동기식 문서 검색"""
@@ -284,7 +365,7 @@ class SyncAPIClient:
             self.async_client.search_documents(query, category, max_results)
         )
     
-    def get_categories(self) -> List[Dict[str, Any]]:
+    def get_categories(self) -> Dict[str, Any]:
         """동기식 카테고리 조회"""
         return self._run_async(self.async_client.get_categories())
     
@@ -298,6 +379,41 @@ class SyncAPIClient:
             self.async_client.send_message(message, session_id)
         )
     
+    def submit_message(self, message: str, session_id: Optional[str] = None) -> concurrent.futures.Future:
+        """메시지 전송을 시작하고 결과를 기다리지 않고 Future 반환
+        
+        요청은 전용 이벤트 루프 스레드에서 진행되며, 결과는 호출한 스크립트 스레드에서
+        Future로 확인하므로 워커가 st.session_state에 접근할 필요가 없습니다.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.async_client.send_message(message, session_id),
+            _LOOP
+        )
+    
+    def stream_message(self, message: str, session_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """동기식 메시지 스트리밍 (이벤트가 도착하는 대로 yield)"""
+        events: queue.Queue = queue.Queue()
+        done = object()
+        
+        async def pump():
+            try:
+                async for event in self.async_client.stream_message(message, session_id):
+                    events.put(event)
+            except Exception as e:
+                events.put(e)
+            finally:
+                events.put(done)
+        
+        asyncio.run_coroutine_threadsafe(pump(), _LOOP)
+        
+        while True:
+            event = events.get()
+            if event is done:
+                return
+            if isinstance(event, Exception):
+                raise event
+            yield event
+    
     def create_session(self, user_id: Optional[str] = None) -> Dict[str, Any]:
         """동기식 세션 생성"""
         return self._run_async(self.async_client.create_session(user_id))
@@ -317,11 +433,41 @@ class SyncAPIClient:
         self._run_async(self.async_client.close())
 
 
+def _shutdown_api_client(async_client: APIClient):
+    """전용 이벤트 루프에서 HTTP 세션 정리 (SyncAPIClient 객체를 참조하지 않아야 finalize가 동작)"""
+    if not _LOOP.is_running():
+        return
+    
+    try:
+        asyncio.run_coroutine_threadsafe(async_client.close(), _LOOP).result(timeout=5.0)
+    except Exception as e:
+        logger.warning(f"API 클라이언트 정리 중 오류: {str(e)}")
+
+
 # Streamlit에서 사용할 API 클라이언트 인스턴스 생성 함수
 @st.cache_resource
 def get_api_client() -> SyncAPIClient:
-    """캐시된 API 클라이언트 인스턴스 반환"""
-    return SyncAPIClient()
+    """캐시된 API 클라이언트 인스턴스 반환
+    
+    프로세스 전체에서 하나의 연결 풀을 공유하며, 캐시에서 제거되어 수거되거나
+    프로세스가 종료될 때 HTTP 세션을 닫습니다.
+    """
+    client = SyncAPIClient()
+    weakref.finalize(client, _shutdown_api_client, client.async_client)
+    return client
+
+
+# 자주 바뀌지 않는 조회 결과는 모든 세션이 공유 (rerun마다 서버를 호출하지 않음)
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_categories() -> List[str]:
+    """카테고리 이름 목록 조회 (1시간 캐시)"""
+    return get_api_client().get_categories().get("categories", [])
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_popular_queries() -> List[str]:
+    """인기 검색어 조회 (1시간 캐시, 실패는 예외로 전달되어 캐시되지 않음)"""
+    return get_api_client().get_popular_queries()
 
 
 # 편의 함수들
@@ -334,22 +480,23 @@ def safe_api_call(func, *args, **kwargs):
         *args, **kwargs: 함수 인수
         
     Returns:
-        결과 또는 None (에러 시)
+        결과 또는 None (API 오류 시, 그 외 예외는 그대로 전파)
     """
     try:
         return func(*args, **kwargs)
-    except Exception as e:
+    except (APIError, httpx.HTTPError) as e:
         st.error(f"API 호출 중 오류가 발생했습니다: {str(e)}")
         logger.error(f"API 호출 오류: {str(e)}")
         return None
 
 
+@st.cache_data(ttl=5, show_spinner=False)
 def check_server_connection() -> bool:
     """
-    서버 연결 상태 확인
+    서버 연결 상태 확인 (5초 캐시하여 rerun마다 헬스체크 요청을 보내지 않음)
     
     Returns:
         bool: 연결 상태
     """
-    client = get_api_client()
-    return safe_api_call(client.health_check) or False
+    # health_check는 실패 시 예외 대신 False를 반환하므로 safe_api_call(st.error) 없이 호출
+    return get_api_client().health_check()
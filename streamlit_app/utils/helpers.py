@@ -5,20 +5,74 @@ Streamlit 앱에서 공통으로 사용되는 헬퍼 함수들입니다.
 """
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
+import base64
 import hashlib
 import json
-import uuid
+import re
+import secrets
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+# 부분 재실행 데코레이터 (st.fragment: 1.37+, st.experimental_fragment: 1.33+)
+# 지원하지 않는 버전에서는 일반 함수로 동작하여 기존처럼 전체 페이지가 다시 실행됨
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# run_every 자동 재실행은 st.fragment(1.37+)에서만 지원 (미지원 버전에서는 None)
+supports_polling_fragment = hasattr(st, "fragment")
+
+def polling_fragment(run_every: float):
+    """주기적으로 자동 재실행되는 fragment 데코레이터 (supports_polling_fragment일 때만 사용)"""
+    return st.fragment(run_every=run_every)
+
+def rerun_fragment() -> None:
+    """현재 fragment만 다시 실행
+    
+    scope 인자를 지원하지 않는 버전이거나 전체 페이지 실행 중 호출된 경우에는 전체 rerun
+    """
+    if hasattr(st, "fragment"):
+        try:
+            st.rerun(scope="fragment")
+        except StreamlitAPIException:
+            pass  # fragment 재실행 중이 아니면 전체 rerun으로 대체
+    st.rerun()
+
+# 페이지 목록 (사이드바 메뉴 순서)
+PAGES = ("검색", "대화상담", "카테고리 탐색", "도움말")
+
+def _get_query_param(name: str) -> Optional[str]:
+    """URL 쿼리 파라미터 조회 (st.query_params: 1.30+, 이전 버전은 experimental API)"""
+    if hasattr(st, "query_params"):
+        return st.query_params.get(name)
+    values = st.experimental_get_query_params().get(name)
+    return values[0] if values else None
+
+def _set_query_param(name: str, value: str) -> None:
+    """URL 쿼리 파라미터 설정"""
+    if hasattr(st, "query_params"):
+        st.query_params[name] = value
+    else:
+        st.experimental_set_query_params(**{name: value})
+
+def get_initial_page() -> str:
+    """URL의 ?page= 값으로 시작 페이지 결정 (새로고침/딥링크 시 마지막 페이지 유지)"""
+    page = _get_query_param("page")
+    return page if page in PAGES else PAGES[0]
+
+def navigate_to(page: str) -> None:
+    """현재 페이지를 세션 상태와 URL(?page=)에 함께 기록"""
+    st.session_state.current_page = page
+    _set_query_param("page", page)
 
 def generate_session_id() -> str:
     """
     고유한 세션 ID 생성
     
     Returns:
-        UUID 기반 세션 ID
+        128비트 난수 기반 세션 ID (32자리 hex, UUID 객체/하이픈 포맷 생략)
     """
-    return str(uuid.uuid4())
+    return secrets.token_hex(16)
 
 def hash_query(query: str) -> str:
     """
@@ -28,9 +82,9 @@ def hash_query(query: str) -> str:
         query: 검색 쿼리
         
     Returns:
-        MD5 해시값
+        BLAKE2b 64비트 해시값 (16자리 hex, 암호용이 아닌 캐시 키 용도)
     """
-    return hashlib.md5(query.encode()).hexdigest()
+    return hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
 
 def format_datetime(dt: datetime) -> str:
     """
@@ -59,6 +113,10 @@ def truncate_text(text: str, max_length: int = 100) -> str:
         return text
     return text[:max_length] + "..."
 
+# sanitize_input용 정규식 (입력마다 패턴 캐시를 조회하지 않도록 미리 컴파일)
+_TAG_RE = re.compile(r'<[^<]+?>')
+_WS_RE = re.compile(r'\s+')
+
 def sanitize_input(user_input: str) -> str:
     """
     사용자 입력 정제
@@ -69,14 +127,11 @@ def sanitize_input(user_input: str) -> str:
     Returns:
         정제된 문자열
     """
-    # HTML 태그 제거 및 기본 정제
-    import re
-    
     # HTML 태그 제거
-    clean_text = re.sub('<[^<]+?>', '', user_input)
+    clean_text = _TAG_RE.sub('', user_input)
     
     # 연속된 공백 제거
-    clean_text = re.sub(r'\s+', ' ', clean_text)
+    clean_text = _WS_RE.sub(' ', clean_text)
     
     # 앞뒤 공백 제거
     clean_text = clean_text.strip()
@@ -108,8 +163,7 @@ def load_from_session_state(key: str, default: Any = None) -> Any:
 
 def clear_session_state() -> None:
     """세션 상태 초기화"""
-    for key in list(st.session_state.keys()):
-        del st.session_state[key]
+    st.session_state.clear()
 
 def display_error_message(error: str, title: str = "오류 발생") -> None:
     """
@@ -131,21 +185,27 @@ def display_success_message(message: str, title: str = "성공") -> None:
     """
     st.success(f"**{title}**\n\n{message}")
 
-def create_download_link(data: str, filename: str, link_text: str) -> str:
+@st.cache_data(show_spinner=False, max_entries=32)
+def _b64(data: bytes) -> str:
+    """base64 인코딩 (같은 데이터는 rerun마다 다시 인코딩하지 않도록 캐시)"""
+    return base64.b64encode(data).decode("ascii")
+
+def create_download_link(data: Union[str, bytes], filename: str, link_text: str) -> str:
     """
     다운로드 링크 생성
     
     Args:
-        data: 다운로드할 데이터
+        data: 다운로드할 데이터 (문자열은 UTF-8로 인코딩)
         filename: 파일명
         link_text: 링크 텍스트
         
     Returns:
         HTML 다운로드 링크
     """
-    import base64
+    if isinstance(data, str):
+        data = data.encode("utf-8")
     
-    b64 = base64.b64encode(data.encode()).decode()
+    b64 = _b64(data)
     href = f'<a href="data:file/txt;base64,{b64}" download="{filename}">{link_text}</a>'
     return href
 
@@ -178,7 +238,7 @@ def get_user_feedback_widget(key: str = "feedback") -> Optional[Dict[str, Any]]:
         key: 위젯 고유 키
         
     Returns:
-        피드백 데이터 또는 None
+        피드백 데이터 또는 None (시각 "ts"는 time.time_ns() 값이며 표시할 때만 포맷)
     """
     st.markdown("---")
     st.subheader("📝 이 답변이 도움이 되었나요?")
@@ -187,59 +247,62 @@ def get_user_feedback_widget(key: str = "feedback") -> Optional[Dict[str, Any]]:
     
     with col1:
         if st.button("👍 좋아요", key=f"{key}_good"):
-            return {"type": "good", "timestamp": datetime.now()}
+            return {"type": "good", "ts": time.time_ns()}
     
     with col2:
         if st.button("👎 별로예요", key=f"{key}_bad"):
-            return {"type": "bad", "timestamp": datetime.now()}
+            return {"type": "bad", "ts": time.time_ns()}
     
     with col3:
         if st.button("💡 개선 제안", key=f"{key}_suggest"):
             suggestion = st.text_area("개선사항을 알려주세요:", key=f"{key}_text")
             if suggestion:
-                return {"type": "suggestion", "text": suggestion, "timestamp": datetime.now()}
+                return {"type": "suggestion", "text": suggestion, "ts": time.time_ns()}
     
     return None
 
+# 커스텀 CSS (배포 중 바뀌지 않으므로 모듈 상수로 한 번만 생성)
+CUSTOM_CSS = """
+<style>
+.stApp {
+    max-width: 1200px;
+    margin: 0 auto;
+}
+
+.main-header {
+    background: linear-gradient(90deg, #1f77b4, #2ca02c);
+    color: white;
+    padding: 1rem;
+    border-radius: 10px;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+
+.search-box {
+    background-color: #f0f2f6;
+    padding: 1rem;
+    border-radius: 10px;
+    border: 2px solid #e1e5e9;
+}
+
+.result-card {
+    background-color: white;
+    padding: 1rem;
+    border-radius: 8px;
+    border: 1px solid #ddd;
+    margin-bottom: 1rem;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.metric-card {
+    background-color: #f8f9fa;
+    padding: 0.5rem;
+    border-radius: 5px;
+    text-align: center;
+}
+</style>
+"""
+
 def load_custom_css() -> None:
     """커스텀 CSS 로드"""
-    st.markdown("""
-    <style>
-    .stApp {
-        max-width: 1200px;
-        margin: 0 auto;
-    }
-    
-    .main-header {
-        background: linear-gradient(90deg, #1f77b4, #2ca02c);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    .search-box {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 10px;
-        border: 2px solid #e1e5e9;
-    }
-    
-    .result-card {
-        background-color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        border: 1px solid #ddd;
-        margin-bottom: 1rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    .metric-card {
-        background-color: #f8f9fa;
-        padding: 0.5rem;
-        border-radius: 5px;
-        text-align: center;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
@@ -4,21 +4,28 @@ Azure OpenAI 설정 검증 스크립트
 """
 
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# 검증할 필수 환경변수
+REQUIRED_VARS = (
+    'AOAI_ENDPOINT',
+    'AOAI_API_KEY',
+    'AOAI_DEPLOY_GPT4O_MINI',
+    'AOAI_DEPLOY_EMBED_3_LARGE'
+)
+
+@lru_cache(maxsize=None)
+def load_aoai_env() -> dict:
+    """.env를 로드하고 필수 환경변수 값을 한 번만 읽어 반환"""
+    load_dotenv()
+    return {name: os.getenv(name) for name in REQUIRED_VARS}
+
 def test_azure_openai_connection():
     """Azure OpenAI 연결 및 설정 테스트"""
     
-    # 1. 환경변수 로드
-    load_dotenv()
-    
-    # 2. 필수 환경변수 확인
-    required_vars = {
-        'AOAI_ENDPOINT': os.getenv('AOAI_ENDPOINT'),
-        'AOAI_API_KEY': os.getenv('AOAI_API_KEY'),
-        'AOAI_DEPLOY_GPT4O_MINI': os.getenv('AOAI_DEPLOY_GPT4O_MINI'),
-        'AOAI_DEPLOY_EMBED_3_LARGE': os.getenv('AOAI_DEPLOY_EMBED_3_LARGE')
-    }
+    # 1~2. 환경변수 로드 및 필수 환경변수 확인 (반복 호출 시 캐시된 값 사용)
+    required_vars = load_aoai_env()
     
     print("=== 환경변수 확인 ===")
     missing_vars = []
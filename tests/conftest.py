@@ -5,9 +5,12 @@ pytest 설정과 공통 테스트 픽스처를 정의합니다.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import httpx
 import sys
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock
 from typing import Generator
 
@@ -30,6 +33,8 @@ os.environ.update({
     "ENVIRONMENT": "test"
 })
 
+# pytest-asyncio 0.21에서는 세션 범위 async 픽스처(http_client)가 세션 범위 event_loop를 요구함
+# (loop_scope 인자는 0.24+ 전용이므로 버전을 올리면 이 픽스처를 삭제하고 loop_scope="session" 사용)
 @pytest.fixture(scope="session")
 def event_loop():
     """이벤트 루프 픽스처"""
@@ -37,23 +42,51 @@ def event_loop():
     yield loop
     loop.close()
 
-@pytest.fixture
-def mock_azure_openai():
-    """Azure OpenAI 클라이언트 모킹"""
+@pytest_asyncio.fixture(scope="session")
+async def http_client():
+    """통합 테스트용 HTTP 클라이언트 (세션 전체에서 연결 풀 공유)"""
+    async with httpx.AsyncClient(
+        base_url="http://localhost:8000",
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    ) as client:
+        yield client
+
+@pytest.fixture(scope="session")
+def sync_api_client():
+    """Streamlit 동기 API 클라이언트 (세션 전체에서 한 인스턴스 공유)"""
+    from streamlit_app.services.api_client import SyncAPIClient
+    
+    client = SyncAPIClient()
+    yield client
+    client.close()
+
+# 테스트용 임베딩 벡터 (768차원, 테스트마다 새로 만들지 않도록 불변 튜플로 한 번만 생성)
+MOCK_EMBEDDING = tuple([0.1, 0.2, 0.3] * 256)
+
+@pytest.fixture(scope="session")
+def _azure_openai_mock():
+    """Azure OpenAI 클라이언트 Mock (세션 전체에서 한 번만 구성)"""
     mock = Mock()
     
-    # 채팅 완성 모킹
+    # 채팅 완성 모킹 (호출 검증이 필요한 create만 Mock, 읽기 전용 응답 객체는 SimpleNamespace)
     mock.chat.completions.create.return_value.choices = [
-        Mock(message=Mock(content="테스트 응답입니다."))
+        SimpleNamespace(message=SimpleNamespace(content="테스트 응답입니다."))
     ]
     
     # 임베딩 모킹
     mock.embeddings.create.return_value.data = [
-        Mock(embedding=[0.1, 0.2, 0.3] * 256)  # 768차원 벡터
+        SimpleNamespace(embedding=MOCK_EMBEDDING)
     ]
     
     return mock
 
+@pytest.fixture
+def mock_azure_openai(_azure_openai_mock):
+    """Azure OpenAI 클라이언트 모킹 (호출 기록만 초기화하고 설정된 반환값은 재사용)"""
+    _azure_openai_mock.reset_mock()
+    return _azure_openai_mock
+
 @pytest.fixture
 def sample_search_request():
     """샘플 검색 요청"""
@@ -75,26 +108,37 @@ def sample_chat_request():
         session_id="test_session_123"
     )
 
-@pytest.fixture
+# 샘플 문서 데이터 (읽기 전용, import 시 한 번만 생성)
+SAMPLE_DOCUMENTS = (
+    MappingProxyType({
+        "id": "doc_001",
+        "title": "청년 주택 지원 정책 안내",
+        "content": "청년을 위한 다양한 주택 지원 정책을 안내합니다.",
+        "category": "주택 정책",
+        "date": "2024-01-15",
+        "keywords": ("청년", "주택", "지원")
+    }),
+    MappingProxyType({
+        "id": "doc_002", 
+        "title": "창업 지원 제도 개요",
+        "content": "창업을 원하는 청년을 위한 지원 제도입니다.",
+        "category": "창업 지원",
+        "date": "2024-01-20",
+        "keywords": ("창업", "청년", "지원")
+    }),
+)
+
+@pytest.fixture(scope="session")
 def sample_documents():
-    """샘플 문서 데이터"""
+    """샘플 문서 데이터 (읽기 전용, 세션 전체에서 공유)"""
+    return SAMPLE_DOCUMENTS
+
+@pytest.fixture
+def sample_documents_mutable():
+    """샘플 문서 데이터 (수정이 필요한 테스트용 복사본)"""
     return [
-        {
-            "id": "doc_001",
-            "title": "청년 주택 지원 정책 안내",
-            "content": "청년을 위한 다양한 주택 지원 정책을 안내합니다.",
-            "category": "주택 정책",
-            "date": "2024-01-15",
-            "keywords": ["청년", "주택", "지원"]
-        },
-        {
-            "id": "doc_002", 
-            "title": "창업 지원 제도 개요",
-            "content": "창업을 원하는 청년을 위한 지원 제도입니다.",
-            "category": "창업 지원",
-            "date": "2024-01-20",
-            "keywords": ["창업", "청년", "지원"]
-        }
+        {**doc, "keywords": list(doc["keywords"])}
+        for doc in SAMPLE_DOCUMENTS
     ]
 
 @pytest.fixture
@@ -119,12 +163,18 @@ def temp_test_dir(tmp_path):
     
     return tmp_path
 
-@pytest.fixture(autouse=True)
-def setup_test_environment(monkeypatch, temp_test_dir):
-    """테스트 환경 자동 설정"""
-    # 테스트용 경로 설정
-    monkeypatch.setenv("VECTOR_DB_PATH", str(temp_test_dir / "data" / "vector_db"))
-    monkeypatch.setenv("SESSION_DB_PATH", str(temp_test_dir / "data" / "sessions.db"))
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment(tmp_path_factory):
+    """테스트 환경 자동 설정 (경로 값이 테스트마다 같으므로 세션 시작 시 한 번만 설정)"""
+    data_dir = tmp_path_factory.mktemp("data")
+    vector_db_dir = data_dir / "vector_db"
+    vector_db_dir.mkdir()
+    
+    # 테스트용 경로 설정 (세션 종료 시 원래 값으로 복원)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("VECTOR_DB_PATH", str(vector_db_dir))
+        mp.setenv("SESSION_DB_PATH", str(data_dir / "sessions.db"))
+        yield
 
 # pytest 설정
 def pytest_configure(config):
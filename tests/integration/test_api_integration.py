@@ -7,55 +7,144 @@ FastAPI 서버와 Streamlit 클라이언트 간의 통합을 테스트합니다.
 import pytest
 import httpx
 import asyncio
-from unittest.mock import patch, Mock
+import gc
+import tracemalloc
+from unittest.mock import patch
 import json
 import time
 from datetime import datetime
 
+# streamlit이 없는 환경에서는 모듈 전체를 건너뜀
+st = pytest.importorskip("streamlit")
 
-class TestAPIIntegration:
-    """API 서버 통합 테스트"""
-    
-    @pytest.fixture
-    def server_url(self):
-        """테스트 서버 URL"""
-        return "http://localhost:8000"
-    
-    @pytest.fixture
-    async def http_client(self, server_url):
-        """비동기 HTTP 클라이언트"""
-        async with httpx.AsyncClient(base_url=server_url, timeout=30.0) as client:
-            yield client
-    
-    @pytest.mark.asyncio
-    async def test_search_api_integration(self, http_client):
-        """검색 API 통합 테스트"""
-        # 검색 요청 데이터
-        search_data = {
+from streamlit_app.services.api_client import (
+    APIClient, APIError, SyncAPIClient, get_api_client, safe_api_call
+)
+from streamlit_app.components.search_interface import perform_search, render_search_results
+from streamlit_app.components.chat_interface import (
+    send_message, initialize_chat_session, start_new_conversation
+)
+
+
+# 단일 요청 API 응답 구조 검증 케이스: (엔드포인트, 요청 데이터, {필드: 타입})
+ENDPOINT_CASES = [
+    pytest.param(
+        "/api/v1/search/query",
+        {
             "query": "주민등록등본 발급 방법",
             "category": "행정절차",
             "max_results": 5
-        }
-        
+        },
+        {
+            "results": list,
+            "summary": str,
+            "total_count": int,
+            "processing_time": (int, float),
+            "confidence_score": (int, float)
+        },
+        id="search_query"
+    ),
+    pytest.param(
+        "/api/v1/chat/session",
+        {},
+        {
+            "session_id": str,
+            "created_at": str,
+            "status": str
+        },
+        id="chat_session"
+    ),
+]
+
+
+# 동시 요청 테스트 설정 (conftest의 max_keepalive_connections와 동일하게 유지)
+CONCURRENT_REQUESTS = 100
+CONCURRENT_LIMIT = 20
+
+# Mock 응답에 사용하는 고정 시각 (테스트마다 시각을 새로 만들지 않도록 import 시 1회 계산)
+FIXED_NOW = datetime(2024, 1, 15, 10, 0, 0).isoformat()
+
+# 클라이언트 생성 시 허용 메모리 증가량
+MEMORY_THRESHOLD_BYTES = 512 * 1024
+
+
+def mock_search_response() -> dict:
+    """Mock 검색 응답 (테스트 중 결과 dict가 변경될 수 있어 매번 새로 생성)"""
+    return {
+        "results": [
+            {
+                "id": "doc_001",
+                "title": "주민등록등본 발급",
+                "content": "주민등록등본 발급 방법",
+                "category": "행정절차",
+                "confidence_score": 0.9
+            }
+        ],
+        "summary": "주민등록등본 발급 방법에 대한 안내",
+        "total_count": 1,
+        "processing_time": 0.5,
+        "confidence_score": 0.9,
+        "suggestions": ["주민등록등본 온라인 발급"]
+    }
+
+
+# 경로별 Mock API 응답 (MockTransport 핸들러에서 사용)
+MOCK_ROUTES = {
+    "/api/v1/search/query": mock_search_response,
+    "/api/v1/chat/session": lambda: {
+        "session_id": "test_session_123",
+        "created_at": FIXED_NOW
+    },
+    "/api/v1/chat/message": lambda: {
+        "message": "출산 지원금에 대해 안내해드리겠습니다.",
+        "session_id": "test_session_123",
+        "message_id": "msg_001",
+        "timestamp": FIXED_NOW,
+        "confidence_score": 0.9,
+        "suggested_questions": ["출산 지원금 신청 방법", "출산 지원금 금액"],
+        "processing_time": 1.2
+    },
+}
+
+
+def mock_api_handler(request: httpx.Request) -> httpx.Response:
+    """요청 경로에 맞는 Mock 응답 반환"""
+    route = MOCK_ROUTES.get(request.url.path)
+    if route is None:
+        return httpx.Response(404, json={"detail": "Not Found"})
+    return httpx.Response(200, json=route())
+
+
+@pytest.fixture(scope="module")
+def mock_api_client():
+    """MockTransport를 주입한 API 클라이언트 (모듈 내 테스트에서 공유)"""
+    client = SyncAPIClient(APIClient(transport=httpx.MockTransport(mock_api_handler)))
+    yield client
+    client.close()
+
+
+@pytest.mark.external
+class TestAPIIntegration:
+    """API 서버 통합 테스트 (실행 중인 서버 필요, --run-integration 옵션으로 실행)"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("endpoint,payload,fields", ENDPOINT_CASES)
+    async def test_endpoint_response_fields(self, http_client, endpoint, payload, fields):
+        """API 응답 구조/타입 통합 테스트"""
         try:
-            response = await http_client.post("/api/v1/search/query", json=search_data)
+            response = await http_client.post(endpoint, json=payload)
             
             # 응답 상태 확인
             assert response.status_code == 200
             
-            # 응답 데이터 구조 확인
+            # 응답 데이터 구조 및 타입 확인
             data = response.json()
-            assert "results" in data
-            assert "summary" in data
-            assert "total_count" in data
-            assert "processing_time" in data
-            assert "confidence_score" in data
+            for field, field_type in fields.items():
+                assert field in data
+                assert isinstance(data[field], field_type)
             
-            # 응답 데이터 타입 확인
-            assert isinstance(data["results"], list)
-            assert isinstance(data["total_count"], int)
-            assert isinstance(data["processing_time"], (int, float))
-            assert 0 <= data["confidence_score"] <= 1
+            if "confidence_score" in fields:
+                assert 0 <= data["confidence_score"] <= 1
             
         except httpx.ConnectError:
             pytest.skip("API 서버가 실행되지 않음")
@@ -110,157 +199,125 @@ class TestAPIIntegration:
     
     @pytest.mark.asyncio
     async def test_concurrent_requests(self, http_client):
-        """동시 요청 처리 테스트"""
-        async def make_health_request():
-            response = await http_client.get("/api/v1/search/health")
-            return response.status_code
+        """동시 요청 처리 테스트 (세션 클라이언트의 keep-alive 연결 재사용 확인)"""
+        # 동시 실행 수를 keep-alive 한도 이하로 제한
+        semaphore = asyncio.Semaphore(CONCURRENT_LIMIT)
+        new_connections = 0
         
-        try:
-            # 5개의 동시 요청
-            tasks = [make_health_request() for _ in range(5)]
+        async def count_connections(event_name, info):
+            """httpx trace 확장: 새 TCP 연결이 열릴 때마다 집계"""
+            nonlocal new_connections
+            if event_name == "connection.connect_tcp.complete":
+                new_connections += 1
+        
+        async def make_health_request():
+            async with semaphore:
+                response = await http_client.get(
+                    "/api/v1/search/health",
+                    extensions={"trace": count_connections}
+                )
+                return response.status_code
+        
+        async def run_batch():
+            tasks = [make_health_request() for _ in range(CONCURRENT_REQUESTS)]
             results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # 모든 요청이 성공했는지 확인
-            success_count = sum(1 for result in results if result == 200)
-            assert success_count >= 4  # 최소 4개 이상 성공
-            
-        except httpx.ConnectError:
-            pytest.skip("API 서버가 실행되지 않음")
+            if any(isinstance(result, httpx.ConnectError) for result in results):
+                pytest.skip("API 서버가 실행되지 않음")
+            return results
+        
+        # 첫 번째 배치: 100개의 동시 요청
+        results = await run_batch()
+        first_batch_connections = new_connections
+        
+        # 대부분의 요청이 성공했는지 확인 (최소 80% 이상 성공)
+        success_count = sum(1 for result in results if result == 200)
+        assert success_count >= CONCURRENT_REQUESTS * 0.8
+        
+        # 두 번째 배치는 첫 배치가 연 keep-alive 연결을 재사용해야 함
+        new_connections = 0
+        await run_batch()
+        assert 0 < first_batch_connections <= CONCURRENT_LIMIT
+        assert new_connections == 0
 
 
 class TestStreamlitClientIntegration:
     """Streamlit 클라이언트 통합 테스트"""
     
-    def test_api_client_initialization(self):
+    def test_api_client_initialization(self, sync_api_client):
         """API 클라이언트 초기화 테스트"""
-        from streamlit_app.services.api_client import SyncAPIClient
-        
-        client = SyncAPIClient()
-        assert client is not None
-        assert hasattr(client, 'async_client')
+        assert sync_api_client is not None
+        assert hasattr(sync_api_client, 'async_client')
     
-    @patch('streamlit_app.services.api_client.httpx.AsyncClient')
-    def test_search_integration(self, mock_httpx):
+    def test_search_integration(self, mock_api_client):
         """검색 기능 통합 테스트"""
-        # Mock HTTP 응답
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "results": [
-                {
-                    "id": "doc_001",
-                    "title": "주민등록등본 발급",
-                    "content": "주민등록등본은...",
-                    "category": "행정절차",
-                    "confidence_score": 0.9
-                }
-            ],
-            "summary": "주민등록등본 발급 방법에 대한 안내",
-            "total_count": 1,
-            "processing_time": 0.5,
-            "confidence_score": 0.9,
-            "suggestions": ["주민등록등본 온라인 발급"]
-        }
+        result = mock_api_client.search_documents("주민등록등본 발급")
         
-        mock_client = Mock()
-        mock_client.post.return_value = mock_response
-        mock_httpx.return_value.__aenter__.return_value = mock_client
-        
-        from streamlit_app.services.api_client import SyncAPIClient
-        
-        client = SyncAPIClient()
-        
-        try:
-            result = client.search_documents("주민등록등본 발급")
-            
-            assert result is not None
-            assert "results" in result
-            assert len(result["results"]) > 0
-            
-        except Exception as e:
-            # 실제 서버 없이도 테스트 가능하도록
-            assert "connection" in str(e).lower() or result is not None
+        assert result is not None
+        assert "results" in result
+        assert len(result["results"]) > 0
     
-    @patch('streamlit_app.services.api_client.httpx.AsyncClient')
-    def test_chat_integration(self, mock_httpx):
+    def test_chat_integration(self, mock_api_client):
         """채팅 기능 통합 테스트"""
-        # Mock HTTP 응답들
-        session_response = Mock()
-        session_response.status_code = 200
-        session_response.json.return_value = {
-            "session_id": "test_session_123",
-            "created_at": datetime.now().isoformat()
-        }
+        # 세션 생성
+        session_result = mock_api_client.create_session()
+        assert "session_id" in session_result
+        
+        # 메시지 전송
+        message_result = mock_api_client.send_message(
+            "출산 지원금에 대해 알려주세요",
+            session_result["session_id"]
+        )
+        assert "message" in message_result
+        assert "suggested_questions" in message_result
+    
+    def test_stream_message(self):
+        """채팅 스트리밍 클라이언트 테스트 (SSE 이벤트 순서대로 전달)"""
+        def stream_handler(request):
+            body = (
+                'data: {"type": "token", "content": "출산 지원금은 "}\n\n'
+                'data: {"type": "token", "content": "신청 가능합니다."}\n\n'
+                'data: {"type": "done", "response": {"session_id": "test_session_123"}}\n\n'
+            )
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
         
-        message_response = Mock()
-        message_response.status_code = 200
-        message_response.json.return_value = {
-            "message": "출산 지원금에 대해 안내해드리겠습니다.",
-            "session_id": "test_session_123",
-            "message_id": "msg_001",
-            "timestamp": datetime.now().isoformat(),
-            "confidence_score": 0.9,
-            "suggested_questions": ["출산 지원금 신청 방법", "출산 지원금 금액"],
-            "processing_time": 1.2
-        }
+        client = SyncAPIClient(APIClient(transport=httpx.MockTransport(stream_handler)))
         
-        mock_client = Mock()
-        mock_client.post.side_effect = [session_response, message_response]
-        mock_httpx.return_value.__aenter__.return_value = mock_client
+        events = list(client.stream_message("출산 지원금에 대해 알려주세요", "test_session_123"))
         
-        from streamlit_app.services.api_client import SyncAPIClient
+        assert [event["type"] for event in events] == ["token", "token", "done"]
+        assert "".join(event["content"] for event in events[:2]) == "출산 지원금은 신청 가능합니다."
+        assert events[-1]["response"]["session_id"] == "test_session_123"
         
-        client = SyncAPIClient()
+        client.close()
+    
+    def test_stream_message_error_event(self):
+        """채팅 스트리밍 error 이벤트 수신 시 APIError 발생 테스트"""
+        def error_handler(request):
+            body = 'data: {"type": "error", "detail": "채팅 처리 중 오류가 발생했습니다"}\n\n'
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
         
-        try:
-            # 세션 생성
-            session_result = client.create_session()
-            assert "session_id" in session_result
-            
-            # 메시지 전송
-            message_result = client.send_message(
-                "출산 지원금에 대해 알려주세요",
-                session_result["session_id"]
-            )
-            assert "message" in message_result
-            assert "suggested_questions" in message_result
-            
-        except Exception as e:
-            # 실제 서버 없이도 테스트 가능하도록
-            assert "connection" in str(e).lower() or session_result is not None
+        client = SyncAPIClient(APIClient(transport=httpx.MockTransport(error_handler)))
+        
+        with pytest.raises(APIError, match="채팅 처리 중 오류"):
+            list(client.stream_message("안녕하세요"))
+        
+        client.close()
 
 
 class TestEndToEndScenarios:
     """전체 시나리오 테스트"""
     
+    # st.session_state를 직접 변경하므로 병렬 실행 시 같은 워커에서 순차 실행
+    @pytest.mark.xdist_group("streamlit_state")
     def test_complete_search_workflow(self):
         """완전한 검색 워크플로우 테스트"""
-        import streamlit as st
-        from streamlit_app.components.search_interface import perform_search
-        from streamlit_app.services.api_client import get_api_client
-        
         # 세션 상태 초기화
         st.session_state.clear()
         st.session_state.search_history = []
         
         # Mock API 응답
         with patch('streamlit_app.services.api_client.safe_api_call') as mock_api:
-            mock_api.return_value = {
-                "results": [
-                    {
-                        "id": "doc_001",
-                        "title": "주민등록등본 발급",
-                        "content": "주민등록등본 발급 방법",
-                        "category": "행정절차",
-                        "confidence_score": 0.9
-                    }
-                ],
-                "summary": "검색 요약",
-                "total_count": 1,
-                "processing_time": 0.5,
-                "confidence_score": 0.9,
-                "suggestions": ["관련 검색어"]
-            }
+            mock_api.return_value = mock_search_response()
             
             try:
                 # 검색 실행
@@ -278,11 +335,9 @@ class TestEndToEndScenarios:
                 # Streamlit 모킹 환경에서는 일부 기능이 제한될 수 있음
                 pass
     
+    @pytest.mark.xdist_group("streamlit_state")
     def test_complete_chat_workflow(self):
         """완전한 채팅 워크플로우 테스트"""
-        import streamlit as st
-        from streamlit_app.components.chat_interface import send_message, initialize_chat_session
-        
         # 세션 상태 초기화
         st.session_state.clear()
         
@@ -290,7 +345,7 @@ class TestEndToEndScenarios:
             # 세션 생성 Mock
             mock_api.return_value = {
                 "session_id": "test_session_123",
-                "created_at": datetime.now().isoformat()
+                "created_at": FIXED_NOW
             }
             
             try:
@@ -306,7 +361,7 @@ class TestEndToEndScenarios:
                     "message": "안녕하세요! 도움을 드리겠습니다.",
                     "session_id": "test_session_123",
                     "message_id": "msg_001",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": FIXED_NOW,
                     "confidence_score": 0.9,
                     "suggested_questions": ["질문 1", "질문 2"],
                     "processing_time": 1.0
@@ -328,19 +383,37 @@ class TestErrorHandling:
     
     def test_api_connection_error(self):
         """API 연결 오류 처리 테스트"""
-        from streamlit_app.services.api_client import safe_api_call
-        
         def failing_function():
-            raise Exception("Connection failed")
+            raise httpx.ConnectError("Connection failed")
         
-        # 오류가 발생해도 None을 반환하고 예외를 발생시키지 않아야 함
+        # API 오류가 발생해도 None을 반환하고 예외를 발생시키지 않아야 함
         result = safe_api_call(failing_function)
         assert result is None
     
+    def test_client_connection_error(self):
+        """클라이언트 연결 오류 전파 테스트"""
+        def refuse_connection(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+        
+        client = SyncAPIClient(APIClient(transport=httpx.MockTransport(refuse_connection)))
+        
+        # 연결 오류는 APIError로 감싸져 원인과 함께 전달되어야 함
+        with pytest.raises(APIError) as exc_info:
+            client.search_documents("주민등록등본 발급")
+        assert isinstance(exc_info.value.__cause__, httpx.ConnectError)
+        
+        client.close()
+    
+    def test_unexpected_error_propagates(self):
+        """API 오류가 아닌 예외는 safe_api_call에서 숨기지 않는지 테스트"""
+        def buggy_function():
+            raise TypeError("unexpected")
+        
+        with pytest.raises(TypeError):
+            safe_api_call(buggy_function)
+    
     def test_invalid_response_handling(self):
         """잘못된 응답 처리 테스트"""
-        from streamlit_app.components.search_interface import render_search_results
-        
         # 잘못된 형태의 응답 데이터
         invalid_results = {
             "results": None,  # 잘못된 타입
@@ -355,11 +428,9 @@ class TestErrorHandling:
             # 예상 가능한 오류만 허용
             assert "results" in str(e) or "invalid" in str(e)
     
+    @pytest.mark.xdist_group("streamlit_state")
     def test_session_timeout_handling(self):
         """세션 타임아웃 처리 테스트"""
-        import streamlit as st
-        from streamlit_app.components.chat_interface import start_new_conversation
-        
         # 기존 세션 데이터 설정
         st.session_state.session_id = "expired_session"
         st.session_state.chat_history = [{"test": "data"}]
@@ -409,73 +480,44 @@ class TestDataValidation:
 class TestPerformanceRequirements:
     """성능 요구사항 테스트"""
     
-    def test_search_response_time(self):
+    def test_search_response_time(self, mock_api_client):
         """검색 응답 시간 테스트 (3초 이내)"""
-        from streamlit_app.services.api_client import SyncAPIClient
+        start_time = time.time()
         
-        client = SyncAPIClient()
+        result = mock_api_client.search_documents("test query")
+        end_time = time.time()
         
-        with patch('streamlit_app.services.api_client.httpx.AsyncClient') as mock_httpx:
-            # 빠른 응답 Mock
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "results": [],
-                "summary": "",
-                "total_count": 0,
-                "processing_time": 0.5,  # 0.5초
-                "confidence_score": 0.0,
-                "suggestions": []
-            }
-            
-            mock_client = Mock()
-            mock_client.post.return_value = mock_response
-            mock_httpx.return_value.__aenter__.return_value = mock_client
-            
-            start_time = time.time()
-            
-            try:
-                result = client.search_documents("test query")
-                end_time = time.time()
-                
-                response_time = end_time - start_time
-                
-                # 3초 이내 응답 확인 (Mock이므로 매우 빠름)
-                assert response_time < 3.0
-                
-                if result and "processing_time" in result:
-                    # API에서 보고한 처리 시간도 3초 이내인지 확인
-                    assert result["processing_time"] < 3.0
-                    
-            except Exception:
-                # 연결 오류 등은 성능 테스트 범위 밖
-                pass
+        response_time = end_time - start_time
+        
+        # 3초 이내 응답 확인 (MockTransport이므로 매우 빠름)
+        assert response_time < 3.0
+        
+        if result and "processing_time" in result:
+            # API에서 보고한 처리 시간도 3초 이내인지 확인
+            assert result["processing_time"] < 3.0
     
-    def test_memory_usage(self):
+    @pytest.fixture
+    def memory_tracer(self):
+        """tracemalloc 추적 (테스트 종료 시 중지)"""
+        tracemalloc.start()
+        yield
+        tracemalloc.stop()
+    
+    def test_memory_usage(self, memory_tracer):
         """메모리 사용량 테스트"""
-        import sys
-        import gc
-        
-        # 가비지 컬렉션 실행
+        # 가비지 컬렉션 후 기준 스냅샷
         gc.collect()
+        before = tracemalloc.take_snapshot()
         
-        # 현재 메모리 사용량 확인 (간접적)
-        initial_objects = len(gc.get_objects())
-        
-        # 컴포넌트 임포트 및 사용
-        from streamlit_app.services.api_client import SyncAPIClient
-        from streamlit_app.components.search_interface import render_search_interface
-        
+        # 측정 대상: 컴포넌트 사용
         client = SyncAPIClient()
         
-        # 가비지 컬렉션 다시 실행
         gc.collect()
+        after = tracemalloc.take_snapshot()
         
-        final_objects = len(gc.get_objects())
-        
-        # 메모리 누수가 심각하지 않은지 확인 (객체 수 증가가 합리적인 범위 내)
-        objects_increase = final_objects - initial_objects
-        assert objects_increase < 1000  # 임의의 합리적인 임계값
+        # 메모리 누수가 심각하지 않은지 확인 (할당 증가량이 합리적인 범위 내)
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, "lineno"))
+        assert allocated < MEMORY_THRESHOLD_BYTES
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+"""
+채팅 스트리밍 API 테스트
+"""
+import pytest
+import orjson
+from datetime import timedelta
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from fastapi import status
+
+from fastapi_server.api import chat
+from fastapi_server.api.chat import format_sse_event
+from fastapi_server.models.common import utc_now
+
+
+def parse_sse_events(body: str) -> list:
+    """SSE 응답 본문을 이벤트 dict 목록으로 변환"""
+    return [
+        orjson.loads(line[len("data: "):])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+@pytest.mark.unit
+class TestChatStream:
+    """채팅 스트리밍 엔드포인트 테스트"""
+    
+    def test_stream_token_and_done_events(self, client: TestClient):
+        """token 이벤트 후 done 이벤트 전송 테스트"""
+        response = client.post(
+            "/api/v1/chat/stream",
+            json={"message": "청년 주택 지원 정책을 알려주세요", "session_id": "stream_session"}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        
+        events = parse_sse_events(response.text)
+        tokens = [event for event in events if event["type"] == "token"]
+        assert len(tokens) > 0
+        
+        # 마지막 이벤트는 /message와 같은 형태의 ChatResponse
+        done = events[-1]
+        assert done["type"] == "done"
+        assert done["response"]["session_id"] == "stream_session"
+        assert "".join(token["content"] for token in tokens) == done["response"]["response"]
+    
+    def test_stream_error_event(self, client: TestClient):
+        """응답 생성 실패 시 error 이벤트 전송 테스트"""
+        with patch(
+            "fastapi_server.api.chat.generate_mock_ai_response",
+            side_effect=RuntimeError("생성 실패")
+        ):
+            response = client.post("/api/v1/chat/stream", json={"message": "안녕하세요"})
+        
+        # 스트림 시작 후 오류이므로 상태 코드는 200이고 error 이벤트로 전달
+        assert response.status_code == status.HTTP_200_OK
+        
+        events = parse_sse_events(response.text)
+        assert [event["type"] for event in events] == ["error"]
+        assert "생성 실패" in events[0]["detail"]
+    
+    def test_format_sse_event_keeps_unicode(self):
+        """SSE 이벤트 형식 및 한글 유지 테스트"""
+        event = format_sse_event({"type": "token", "content": "안녕하세요"})
+        
+        assert event.startswith("data: ")
+        assert event.endswith("\n\n")
+        assert "안녕하세요" in event
+        assert parse_sse_events(event) == [{"type": "token", "content": "안녕하세요"}]
+
+
+@pytest.mark.unit
+class TestSessionCleanup:
+    """만료 세션 정리 테스트"""
+    
+    def test_cleanup_removes_idle_session_without_messages(self, client: TestClient):
+        """메시지 없이 생성만 된 세션도 만료 시 정리되는지 테스트"""
+        session_id = client.post("/api/v1/chat/session").json()["session_id"]
+        
+        # 방금 생성된 세션은 유지
+        chat.cleanup_expired_sessions(expire_hours=1)
+        assert session_id in chat.temp_sessions
+        
+        # 마지막 활동이 만료 시간 이전이면 삭제
+        chat.session_last_activity[session_id] = utc_now() - timedelta(hours=2)
+        assert chat.cleanup_expired_sessions(expire_hours=1) >= 1
+        assert session_id not in chat.temp_sessions
+        assert session_id not in chat.session_last_activity
+    
+    def test_message_refreshes_session_activity(self, client: TestClient):
+        """메시지 저장 시 마지막 활동 시각이 갱신되는지 테스트"""
+        session_id = client.post("/api/v1/chat/session").json()["session_id"]
+        chat.session_last_activity[session_id] = utc_now() - timedelta(hours=2)
+        
+        client.post("/api/v1/chat/message", json={"message": "안녕하세요", "session_id": session_id})
+        
+        chat.cleanup_expired_sessions(expire_hours=1)
+        assert session_id in chat.temp_sessions
+        assert chat.session_last_activity[session_id].tzinfo is not None
+        
+        client.delete(f"/api/v1/chat/session/{session_id}")
+        assert session_id not in chat.session_last_activity
@@ -122,6 +122,35 @@ class TestStateManager:
         assert error_state["error_message"] == error_message
         assert error_state["retry_count"] == 1
     
+    def test_add_processing_time_in_place(self):
+        """처리 시간 추가 - 제자리 수정 / 복사본 반환 테스트"""
+        state = StateManager.create_initial_state("session", "query")
+        
+        result = StateManager.add_processing_time(state, "query_analysis", 1.5)
+        assert result is state
+        assert state["processing_times"] == {"query_analysis": 1.5}
+        
+        copied = StateManager.add_processing_time_copy(state, "document_retrieval", 2.0)
+        assert copied is not state
+        assert copied["processing_times"] == {"query_analysis": 1.5, "document_retrieval": 2.0}
+        assert "document_retrieval" not in state["processing_times"]
+    
+    def test_in_place_updates_keep_previous_state(self):
+        """제자리 수정이 이전 상태의 중첩 dict를 변경하지 않는지 테스트"""
+        original = StateManager.create_initial_state("session", "query")
+        original = StateManager.add_processing_time(original, "query_analysis", 1.5)
+        original = StateManager.add_context(original, "user_type", "청년")
+        
+        # update_state는 얕은 복사이므로 중첩 dict를 원본과 공유한 상태로 시작
+        updated = StateManager.update_state(original, {"retry_count": 1})
+        StateManager.add_processing_time(updated, "document_retrieval", 2.0)
+        StateManager.add_context(updated, "region", "서울")
+        
+        assert original["processing_times"] == {"query_analysis": 1.5}
+        assert original["context"] == {"user_type": "청년"}
+        assert updated["processing_times"] == {"query_analysis": 1.5, "document_retrieval": 2.0}
+        assert updated["context"] == {"user_type": "청년", "region": "서울"}
+    
     def test_validate_state(self):
         """상태 유효성 검증 테스트"""
         valid_state = StateManager.create_initial_state("session", "query")
@@ -192,6 +221,20 @@ class TestWorkflowRouter:
         assert decision["next_step"] == WorkflowNodes.ERROR
         assert "No documents found" in decision["reason"]
     
+    def test_route_after_retrieval_limited_results(self):
+        """문서 검색 후 결과가 적을 때 라우팅 테스트"""
+        state = StateManager.create_initial_state("session", "query")
+        state = StateManager.update_state(state, {
+            "total_results_count": 1,
+            "current_step": "document_retrieval"
+        })
+        
+        decision = WorkflowRouter.route_after_retrieval(state)
+        
+        assert decision["next_step"] == WorkflowNodes.CONTENT_PROCESSING
+        assert decision["confidence"] == 0.6
+        assert decision["metadata"]["warning"] == "limited_results"
+    
     def test_route_after_processing_success(self):
         """내용 처리 후 성공 라우팅 테스트"""
         state = StateManager.create_initial_state("session", "query")
@@ -356,6 +399,22 @@ class TestWorkflowIntegration:
         assert recovery_decision["next_step"] == "query_analysis"
         assert StateManager.can_retry(error_state)
     
+    @pytest.mark.parametrize("error_message, expected_step, retry_from", [
+        ("Query analysis failed: timeout", "query_analysis", "analysis"),
+        ("Document RETRIEVAL failed", "document_retrieval", "retrieval"),
+        ("Content processing node error", "content_processing", "processing"),
+        ("unknown failure", "query_analysis", "beginning"),
+    ])
+    def test_route_from_error_by_message(self, error_message, expected_step, retry_from):
+        """에러 메시지별 재시도 위치 테스트"""
+        state = StateManager.create_initial_state("session-457", "테스트 질의")
+        error_state = StateManager.set_error(state, error_message)
+        
+        decision = WorkflowRouter.route_from_error(error_state)
+        
+        assert decision["next_step"] == expected_step
+        assert decision["metadata"]["retry_from"] == retry_from
+    
     def test_state_serialization_workflow(self):
         """상태 직렬화 워크플로우 테스트"""
         state = StateManager.create_initial_state("session-789", "복잡한 질의")
@@ -13,6 +13,7 @@ from fastapi_server.models.schemas import (
     DocumentResult, AgentState, MessageRole, SessionStatus,
     DifficultyLevel, AgentStep, SortBy
 )
+from fastapi_server.models.common import SourceInfo, PaginationInfo
 
 
 @pytest.mark.unit
@@ -92,6 +93,15 @@ class TestSearchRequest:
         # 임시 검증
         normalized = " ".join(request_data["query"].split())
         assert normalized == "주민등록등본 발급 방법"
+    
+    def test_search_request_filters_must_be_object(self):
+        """추가 필터 타입(object) 검증 테스트"""
+        request = SearchRequest(query="테스트", filters={"region": "서울"})
+        assert request.filters == {"region": "서울"}
+        
+        for invalid_filters in ("region=서울", ["서울"], 1):
+            with pytest.raises(ValueError):
+                SearchRequest(query="테스트", filters=invalid_filters)
 
 
 @pytest.mark.unit
@@ -444,6 +454,50 @@ class TestAgentState:
         
         # 임시 검증
         assert len(state_data["user_query"]) == 0
+    
+    def test_agent_state_transition_to(self):
+        """Agent 상태 단계 전환 테스트"""
+        state = AgentState(session_id="session_126", user_query="주민등록등본 발급")
+        
+        state.transition_to(AgentStep.DOCUMENT_RETRIEVAL)
+        assert state.current_step == AgentStep.DOCUMENT_RETRIEVAL
+        
+        with pytest.raises(ValueError, match="Invalid step transition"):
+            state.transition_to(AgentStep.COMPLETED)
+    
+    def test_agent_state_set_error(self):
+        """Agent 상태 에러 전환 테스트"""
+        state = AgentState(session_id="session_127", user_query="주민등록등본 발급")
+        
+        with pytest.raises(ValueError, match="Error message is required"):
+            state.transition_to(AgentStep.ERROR)
+        
+        state.set_error("검색 실패")
+        assert state.is_error()
+        assert state.error == "검색 실패"
+
+
+@pytest.mark.unit
+class TestCommonValueObjects:
+    """공통 값 객체(dataclass) 테스트"""
+    
+    def test_source_info_reliability_range(self):
+        """소스 신뢰도 범위(0-1) 검증 테스트"""
+        assert SourceInfo(title="정책 문서", type="policy", reliability=0.8).reliability == 0.8
+        
+        with pytest.raises(ValueError):
+            SourceInfo(title="정책 문서", type="policy", reliability=1.5)
+    
+    def test_pagination_info_bounds(self):
+        """페이지 번호/크기 범위 검증 테스트"""
+        pagination = PaginationInfo(total_count=25, total_pages=3, has_next=True, has_previous=False)
+        assert pagination.page == 1
+        assert pagination.page_size == 10
+        
+        with pytest.raises(ValueError):
+            PaginationInfo(total_count=25, total_pages=3, has_next=True, has_previous=False, page=0)
+        with pytest.raises(ValueError):
+            PaginationInfo(total_count=25, total_pages=3, has_next=True, has_previous=False, page_size=101)
 
 
 @pytest.mark.unit
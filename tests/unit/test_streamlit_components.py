@@ -72,6 +72,33 @@ class TestSearchInterface:
         except Exception as e:
             pytest.fail(f"render_popular_queries failed: {e}")
     
+    @patch('streamlit_app.components.search_interface.cached_categories')
+    def test_get_category_options(self, mock_cached_categories):
+        """카테고리 필터 선택지 테스트"""
+        from streamlit_app.components.search_interface import (
+            DEFAULT_CATEGORIES, get_category_options
+        )
+        from streamlit_app.services.api_client import APIError
+        
+        st.session_state.pop('category_retry_at', None)
+        
+        # 서버 목록 사용
+        mock_cached_categories.return_value = ["복지 정책", "주택 정책"]
+        assert get_category_options() == ["전체", "복지 정책", "주택 정책"]
+        
+        # API 오류 시 오류 배너 없이 기본 목록 사용
+        mock_cached_categories.side_effect = APIError("서버 연결 실패")
+        with patch('streamlit.error') as mock_error:
+            assert get_category_options() == ["전체"] + DEFAULT_CATEGORIES
+        mock_error.assert_not_called()
+        
+        # 재시도 간격 동안은 서버를 다시 호출하지 않음
+        mock_cached_categories.reset_mock()
+        assert get_category_options() == ["전체"] + DEFAULT_CATEGORIES
+        mock_cached_categories.assert_not_called()
+        
+        st.session_state.pop('category_retry_at', None)
+    
     @patch('streamlit_app.components.search_interface.get_api_client')
     @patch('streamlit_app.components.search_interface.safe_api_call')
     def test_perform_search(self, mock_safe_api_call, mock_get_api_client):
@@ -140,6 +167,20 @@ class TestSearchInterface:
             render_single_result(sample_result, 0)
         except Exception as e:
             pytest.fail(f"render_single_result failed: {e}")
+    
+    def test_get_result_display_keeps_result_unchanged(self):
+        """표시용 값은 세션 상태에 캐시되고 결과 dict는 변경되지 않는지 테스트"""
+        from streamlit_app.components.search_interface import get_result_display
+        
+        st.session_state.result_displays = {}
+        result = {"category": "정책안내", "confidence_score": 0.85, "content": "내용"}
+        original = dict(result)
+        
+        display = get_result_display(result, 0)
+        
+        assert result == original
+        assert display["meta"] == "**카테고리:** 정책안내 | **관련도:** 85%"
+        assert get_result_display(result, 0) is display
 
 
 class TestChatInterface:
@@ -317,6 +358,34 @@ class TestSidebar:
             
         except Exception as e:
             pytest.fail(f"render_chat_settings failed: {e}")
+    
+    @patch('streamlit_app.components.chat_interface.get_api_client')
+    @patch('streamlit_app.components.chat_interface.safe_api_call')
+    def test_new_conversation_button_discards_pending_reply(
+        self, mock_safe_api_call, mock_get_api_client
+    ):
+        """새 대화 시작 버튼이 이전 대화의 진행 중인 응답을 버리는지 테스트"""
+        from concurrent.futures import Future
+        from streamlit_app.components.sidebar import render_chat_settings
+        
+        # 이전 대화의 응답이 아직 히스토리에 반영되지 않은 상태
+        pending = Future()
+        pending.set_result({"response": "이전 대화 응답", "session_id": "old_session"})
+        st.session_state.pending_reply = pending
+        st.session_state.session_id = "old_session"
+        st.session_state.chat_history = [{"role": "user", "content": "이전 질문"}]
+        
+        mock_safe_api_call.return_value = {"session_id": "new_session"}
+        
+        with patch('streamlit.button', return_value=True):
+            render_chat_settings()
+        
+        assert 'pending_reply' not in st.session_state
+        assert st.session_state.session_id == "new_session"
+        assert all(
+            message.get("content") != "이전 대화 응답"
+            for message in st.session_state.chat_history
+        )
 
 
 class TestAPIClient:
@@ -363,10 +432,10 @@ class TestAPIClient:
     
     def test_safe_api_call_failure(self):
         """안전한 API 호출 실패 테스트"""
-        from streamlit_app.services.api_client import safe_api_call
+        from streamlit_app.services.api_client import APIError, safe_api_call
         
         def mock_function():
-            raise Exception("Test error")
+            raise APIError("Test error")
         
         try:
             result = safe_api_call(mock_function)